@@ -1,12 +1,12 @@
-from fastapi import FastAPI, Query
-from pydantic import BaseModel
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, field_validator
 from typing import Any, Dict
+import asyncio
 import logging
-import os
-import json
-import browser_setup
+from concurrent.futures import ThreadPoolExecutor
+from browser_pool import POOL_SIZE, create_pool
 from scrape_tabs import scrape_all_tabs
-import time
 
 # Import centralized logging setup
 from logging_setup import setup_logging
@@ -16,63 +16,86 @@ logger = logging.getLogger(__name__)
 
 # Import high-level automation functions from main.py
 from main import (
-    click_okay_button, select_company_type, select_company_class, select_company_category,
-    select_company_subcategory, open_nic_code_dialog, select_nic_codes_dynamic, enter_company_name,
-    handle_name_check_and_submit, load_config # load_config is needed to get base config
+    click_okay_button, select_company_profile, open_nic_code_dialog, select_nic_codes_dynamic, enter_company_name,
+    handle_name_check_and_submit, load_config, freeze_config # load_config is needed to get base config
 )
 from selenium_utils import AutomationError, VerificationStepFailed # Import custom exceptions
 
-app = FastAPI(title="Company Name Check API", docs_url="/docs")
+# ORJSONResponse serializes the large scraped-table payloads with orjson
+# straight to bytes instead of stdlib json + a separate encode step.
+app = FastAPI(title="Company Name Check API", docs_url="/docs", default_response_class=ORJSONResponse)
 
 # Load base config once at startup
-BASE_CONFIG = load_config()
+BASE_CONFIG = freeze_config(load_config())
+
+# Pool of pre-warmed browsers shared by all requests
+pool = create_pool(BASE_CONFIG)
+
+# Selenium work runs on this executor so the async endpoints never block the
+# event loop; its size matches the pool so excess requests queue here instead
+# of tying up FastAPI's default (much larger) threadpool.
+EXECUTOR = ThreadPoolExecutor(max_workers=POOL_SIZE, thread_name_prefix="name-check-api")
+
+
+@app.on_event("startup")
+def warm_browser_pool():
+    """Pre-warm the browser pool in the background so startup isn't blocked."""
+    import threading
+    threading.Thread(target=pool.start, daemon=True).start()
+
+
+@app.on_event("shutdown")
+def close_browser_pool():
+    pool.shutdown()
 
 class NameCheckRequest(BaseModel):
+    # Whitespace stripping happens in pydantic's Rust core and the single
+    # field_validator runs once per request, rather than per-item Python
+    # callbacks; frozen lets the compiled schema treat instances as immutable.
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
+
     company_name: str
 
+    @field_validator("company_name")
+    @classmethod
+    def _require_non_empty(cls, value: str) -> str:
+        if not value:
+            raise ValueError("company_name must not be empty")
+        return value
+
 @app.post("/check_name")
-def check_name(request: NameCheckRequest) -> Dict[str, Any]:
+async def check_name(request: NameCheckRequest) -> Dict[str, Any]:
     """
     Run the name check automation for the provided company name and return the scraped results.
     """
-    config = BASE_CONFIG.copy() # Start with a copy of the base config
-    
-    # Ensure 'meta' key exists and is mutable
-    if "meta" not in config:
-        config["meta"] = {}
-    config["meta"] = config["meta"].copy()
-    
-    # Update company name for this specific request
-    config["meta"]["company_name"] = request.company_name
+    return await asyncio.get_running_loop().run_in_executor(
+        EXECUTOR, _run_check, request.company_name
+    )
+
+
+def _run_check(company_name: str) -> Dict[str, Any]:
+    """Blocking automation body; runs on EXECUTOR threads."""
+    # BASE_CONFIG is frozen, so a single dict spread (one C-level copy per
+    # mapping) is enough to get a request-local view with the name swapped in.
+    config = {**BASE_CONFIG, "meta": {**BASE_CONFIG["meta"], "company_name": company_name}}
     
-    driver = None
     try:
-        logger.info(f"[API] Starting browser for company name: {request.company_name}")
-        driver = browser_setup.initialize_browser(config)
-        
-        # --- Execute the minimal automation steps up to and including the auto-check ---
-        # Pass the driver instance to each function
-        click_okay_button(driver)
-        select_company_type(driver)
-        select_company_class(driver)
-        select_company_category(driver)
-        select_company_subcategory(driver)
-        open_nic_code_dialog(driver)
-        select_nic_codes_dynamic(driver, config['meta']['nic_code'])
-        enter_company_name(driver, config['meta']['company_name'])
-        handle_name_check_and_submit(driver)
-        
-        time.sleep(3)  # Wait for tables to load after auto-check
-
-        # --- Scrape the tabs ---
-        # Pass the driver instance to scrape_all_tabs
-        result = scrape_all_tabs(driver, output_json_path=None)  # Don't write to file, just return dict
-        
+        logger.info(f"[API] Acquiring pooled browser for company name: {company_name}")
+        with pool.acquire() as driver:
+            # --- Execute the minimal automation steps up to and including the auto-check ---
+            # Pass the driver instance to each function
+            click_okay_button(driver)
+            select_company_profile(driver)
+            open_nic_code_dialog(driver)
+            select_nic_codes_dynamic(driver, config['meta']['nic_code'])
+            enter_company_name(driver, config['meta']['company_name'])
+            handle_name_check_and_submit(driver)
+
+            # --- Scrape the tabs ---
+            # Pass the driver instance to scrape_all_tabs
+            result = scrape_all_tabs(driver, output_json_path=None)  # Don't write to file, just return dict
+
         return {"success": True, "data": result}
     except (AutomationError, VerificationStepFailed, Exception) as e:
-        logger.exception(f"[API] Error during name check automation for '{request.company_name}': {e}")
-        return {"success": False, "error": str(e)}
-    finally:
-        if driver:
-            driver.quit()
-            logger.info("[API] Browser closed after API call")
\ No newline at end of file
+        logger.exception(f"[API] Error during name check automation for '{company_name}': {e}")
+        return {"success": False, "error": str(e)}
\ No newline at end of file
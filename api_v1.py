@@ -1,19 +1,21 @@
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, field_validator
 from typing import Any, Dict
+import asyncio
 import logging
-import time
-# import os # No longer needed
+from concurrent.futures import ThreadPoolExecutor
 
-# Import browser and automation setup
-import browser_setup
+import tasks
+from browser_pool import POOL_SIZE, create_pool
+from cache import RedisCache, normalize_company_name
+from conflict_analyser import ConflictAnalyser
 from scrape_tabs import scrape_all_tabs
 
 # Import high-level automation functions from main.py
 from main import (
-    click_okay_button, select_company_type, select_company_class, select_company_category,
-    select_company_subcategory, open_nic_code_dialog, select_nic_codes_dynamic, enter_company_name,
-    handle_name_check_and_submit, load_config
+    click_okay_button, select_company_profile, open_nic_code_dialog, select_nic_codes_dynamic, enter_company_name,
+    handle_name_check_and_submit, load_config, freeze_config
 )
 
 # Import specific exceptions to handle them gracefully
@@ -32,16 +34,54 @@ app = FastAPI(
     title="Company Name Check API",
     description="An API to automate company name availability checks on the MCA portal.",
     docs_url="/docs",
-    openapi_prefix="/name-check"
+    openapi_prefix="/name-check",
+    # Scraped-table payloads are large; orjson encodes them straight to
+    # bytes several times faster than stdlib json.
+    default_response_class=ORJSONResponse
 )
 
 # Load base configuration once at startup
-BASE_CONFIG = load_config()
+BASE_CONFIG = freeze_config(load_config())
+
+# Pool of pre-warmed browsers shared by all requests
+pool = create_pool(BASE_CONFIG)
+
+# Cache of scraped results so repeat queries skip the browser entirely
+cache = RedisCache()
+
+# Selenium work runs on this executor so the async endpoint never blocks the
+# event loop; its size matches the pool so excess requests queue here instead
+# of tying up FastAPI's default (much larger) threadpool.
+EXECUTOR = ThreadPoolExecutor(max_workers=POOL_SIZE, thread_name_prefix="name-check-api")
+
+
+@app.on_event("startup")
+def warm_browser_pool():
+    """Pre-warm the browser pool in the background so startup isn't blocked."""
+    import threading
+    threading.Thread(target=pool.start, daemon=True).start()
+
+
+@app.on_event("shutdown")
+def close_browser_pool():
+    pool.shutdown()
 
 # Define the request model - NOW ONLY CONTAINS company_name
 class NameCheckRequest(BaseModel):
+    # Whitespace stripping happens in pydantic's Rust core and the single
+    # field_validator runs once per request, rather than per-item Python
+    # callbacks; frozen lets the compiled schema treat instances as immutable.
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
+
     company_name: str
 
+    @field_validator("company_name")
+    @classmethod
+    def _require_non_empty(cls, value: str) -> str:
+        if not value:
+            raise ValueError("company_name must not be empty")
+        return value
+
 # Define the standard success and error response models for documentation
 class SuccessResponse(BaseModel):
     success: bool = True
@@ -52,43 +92,52 @@ class ErrorResponse(BaseModel):
     data: None = None
     error: str
 
-@app.post("/check_name", responses={200: {"model": SuccessResponse}})
-def check_name(request: NameCheckRequest):
-    """
-    Runs the full automation to check company name availability on the MCA portal.
-
-    - **Launches a browser** and automates the form-filling process.
-    - **Scrapes the results** and returns them in a JSON format.
-    """
+def _run_name_check(company_name: str):
+    """Run the full name-check automation and return the response payload."""
     # --- Step 1 (was 2): Prepare configuration and start automation ---
-    config = BASE_CONFIG.copy()
-    config["meta"] = config["meta"].copy()
-    config["meta"]["company_name"] = request.company_name
+    # BASE_CONFIG is frozen at startup, so one dict-spread expression gives a
+    # request-local view with the company name swapped in.
+    config = {**BASE_CONFIG, "meta": {**BASE_CONFIG["meta"], "company_name": company_name}}
     # The nic_code is now taken directly from the loaded base config
 
-    driver = None
+    # Repeat queries for the same (normalized) name skip the browser entirely.
+    cache_key = {
+        "name": normalize_company_name(company_name),
+        "nic": config["meta"]["nic_code"],
+        "type": "check_name",
+    }
+    cached = cache.get(cache_key)
+    if cached is not None:
+        logger.info(f"[API] Cache hit for: '{company_name}'")
+        return {"success": True, "data": cached, "analysis": ConflictAnalyser(cached).summary(company_name), "cached": True}
+
     try:
-        logger.info(f"[API] Initializing browser for: '{request.company_name}'")
-        driver = browser_setup.initialize_browser(config)
-
-        # Execute the automation steps
-        click_okay_button(driver)
-        select_company_type(driver)
-        select_company_class(driver)
-        select_company_category(driver)
-        select_company_subcategory(driver)
-        open_nic_code_dialog(driver)
-        select_nic_codes_dynamic(driver, config['meta']['nic_code'])
-        enter_company_name(driver, config['meta']['company_name'])
-        handle_name_check_and_submit(driver)
-
-        time.sleep(3)  # Wait for results to load
-
-        # Scrape the data from the result tabs
-        result = scrape_all_tabs(driver, output_json_path=None)
-        
-        logger.info(f"[API] Successfully completed automation for: '{request.company_name}'")
-        return {"success": True, "data": result}
+        logger.info(f"[API] Acquiring pooled browser for: '{company_name}'")
+        with pool.acquire() as driver:
+            # Execute the automation steps
+            click_okay_button(driver)
+            select_company_profile(driver)
+            open_nic_code_dialog(driver)
+            select_nic_codes_dynamic(driver, config['meta']['nic_code'])
+            enter_company_name(driver, config['meta']['company_name'])
+            handle_name_check_and_submit(driver)
+
+            # Scrape the data from the result tabs. A clean errors tab already
+            # proves the name is VALID, so the advisory tabs are skipped then.
+            result = scrape_all_tabs(
+                driver,
+                output_json_path=None,
+                on_tab_scraped=lambda key, data: (
+                    key == "error" and not ConflictAnalyser({"error": data}).has_blocking_error()
+                ),
+            )
+
+        logger.info(f"[API] Successfully completed automation for: '{company_name}'")
+        # A missing errors tab means the verdict is UNKNOWN; caching that
+        # would pin an inconclusive answer for the whole cache TTL.
+        if result.get("error") is not None:
+            cache.set(cache_key, result)
+        return {"success": True, "data": result, "analysis": ConflictAnalyser(result).summary(company_name)}
 
     # --- Step 3: Comprehensive Error Handling ---
     except (AutomationError, VerificationStepFailed) as e:
@@ -115,8 +164,37 @@ def check_name(request: NameCheckRequest):
             return {"success": False, "data": None, "error": "A critical error occurred with the automation browser. Please try again."}
         return {"success": False, "data": None, "error": f"An unexpected error occurred: {e}. Site might be slow or unresponsive."}
 
-    finally:
-        # --- Step 4: Cleanup ---
-        if driver:
-            driver.quit()
-            logger.info("[API] Browser session closed.")
\ No newline at end of file
+
+@app.post("/check_name", responses={200: {"model": SuccessResponse}})
+async def check_name(request: NameCheckRequest):
+    """
+    Runs the full automation to check company name availability on the MCA portal.
+
+    - **Launches a browser** and automates the form-filling process.
+    - **Scrapes the results** and returns them in a JSON format.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        EXECUTOR, _run_name_check, request.company_name
+    )
+
+
+@app.post("/check_name/jobs")
+def submit_check_name(request: NameCheckRequest):
+    """
+    Queue the name-check automation as a background job and return immediately.
+
+    The multi-minute Selenium flow runs on a worker thread; clients poll
+    GET /check_name/jobs/{job_id} for the outcome.
+    """
+    job_id = tasks.submit_job(_run_name_check, request.company_name)
+    return {"job_id": job_id}
+
+
+@app.get("/check_name/jobs/{job_id}")
+def get_check_name_job(job_id: str):
+    """Return the status (and, once finished, the result) of a queued job."""
+    entry = tasks.get_job(job_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired job id.")
+    entry.pop("expires_at", None)
+    return entry
\ No newline at end of file
@@ -0,0 +1,229 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+from contextlib import contextmanager
+
+from selenium.common.exceptions import WebDriverException
+
+import browser_setup
+from selenium_utils import AutomationError, invalidate_element_cache
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+# Pool sizing is environment-driven so deployments can match host capacity.
+POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "4"))
+MAX_USES_PER_INSTANCE = int(os.getenv("BROWSER_MAX_USES_PER_INSTANCE", "50"))
+
+
+class _PooledDriver:
+    """Wraps a WebDriver with a use counter so the pool knows when to recycle it."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.use_count = 0
+
+
+class BrowserPool:
+    """
+    A bounded pool of pre-initialized Selenium drivers.
+
+    Drivers are created once at startup (amortizing the multi-second browser
+    launch + login cost) and handed out per request via acquire(). After each
+    use the driver is navigated back to the start URL for the next request;
+    the authenticated MCA session (cookies/localStorage) is deliberately kept,
+    since re-logging in per request would forfeit most of the pooling win.
+    A driver is recycled (quit + relaunched) after MAX_USES_PER_INSTANCE uses
+    or whenever the automation raised an error, since a failed flow may leave
+    the page in an unknown state.
+    """
+
+    def __init__(self, config: dict, size: int = POOL_SIZE):
+        self._config = config
+        self._size = size
+        self._queue = queue.Queue(maxsize=size)
+        self._lock = threading.Lock()
+        self._started = False
+
+    def start(self):
+        """Fill the pool by launching drivers up-front. Called at API startup."""
+        with self._lock:
+            if self._started:
+                logger.info('[POOL] Browser pool already started, skipping re-initialization.')
+                return
+            self._started = True
+        logger.info(f'[POOL] Pre-warming browser pool with {self._size} driver(s)')
+        for i in range(self._size):
+            try:
+                driver = browser_setup.initialize_browser(self._config)
+                self._queue.put(_PooledDriver(driver))
+                logger.info(f'[POOL] Driver {i + 1}/{self._size} ready')
+            except Exception as e:
+                logger.error(f'[POOL] Failed to pre-warm driver {i + 1}/{self._size}: {e}')
+                # Leave a slot for lazy creation on first acquire instead of
+                # failing the whole startup.
+                self._queue.put(None)
+
+    @contextmanager
+    def acquire(self, timeout: int = 300):
+        """
+        Context manager yielding a ready driver from the pool.
+
+        On clean exit the driver is reset and returned to the pool; on
+        automation/WebDriver errors it is recycled before being returned.
+        """
+        pooled = self._queue.get(timeout=timeout)
+        if pooled is None:
+            # A startup slot that failed to warm; create the driver now. If
+            # that fails too, the empty slot must go back on the queue or the
+            # pool shrinks permanently with every failed init.
+            logger.info('[POOL] Lazily initializing a driver for an empty pool slot')
+            try:
+                pooled = _PooledDriver(browser_setup.initialize_browser(self._config))
+            except Exception:
+                self._queue.put(None)
+                raise
+        recycle = False
+        try:
+            yield pooled.driver
+        except (AutomationError, WebDriverException):
+            recycle = True
+            raise
+        finally:
+            pooled.use_count += 1
+            if recycle or pooled.use_count >= MAX_USES_PER_INSTANCE:
+                pooled = self._recycle(pooled)
+            else:
+                pooled = self._reset(pooled)
+            self._queue.put(pooled)
+
+    def _reset(self, pooled: _PooledDriver) -> _PooledDriver:
+        """Navigate back to the start URL for reuse, keeping the login session."""
+        try:
+            pooled.driver.get(self._config["meta"]["url"])
+            # Navigation point: cached elements reference the old document.
+            invalidate_element_cache(pooled.driver)
+            return pooled
+        except WebDriverException as e:
+            logger.warning(f'[POOL] Driver reset failed, recycling instead: {e}')
+            return self._recycle(pooled)
+
+    def _recycle(self, pooled: _PooledDriver) -> _PooledDriver:
+        """Quit a worn-out or broken driver and replace it with a fresh one."""
+        logger.info(f'[POOL] Recycling driver after {pooled.use_count} use(s)')
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.warning(f'[POOL] Error quitting driver during recycle: {e}')
+        try:
+            return _PooledDriver(browser_setup.initialize_browser(self._config))
+        except Exception as e:
+            logger.error(f'[POOL] Failed to relaunch driver during recycle: {e}')
+            return None  # Slot will be lazily re-initialized on next acquire
+
+    def shutdown(self):
+        """Quit all pooled drivers. Called at API shutdown."""
+        logger.info('[POOL] Shutting down browser pool')
+        while True:
+            try:
+                pooled = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if pooled is not None:
+                try:
+                    pooled.driver.quit()
+                except Exception as e:
+                    logger.warning(f'[POOL] Error quitting driver during shutdown: {e}')
+
+
+class TabPool:
+    """
+    A low-memory alternative to BrowserPool: one shared Firefox instance
+    serves every request, with each request running in its own freshly
+    opened tab that is closed afterwards.
+
+    A single WebDriver session cannot safely interleave commands from
+    multiple tabs (every command targets the currently focused window),
+    so access is serialized by a lock. This trades the concurrency of
+    BrowserPool for a ~(N-1)x reduction in browser memory/CPU footprint;
+    select it with BROWSER_POOL_MODE=tabs on memory-constrained hosts.
+    """
+
+    def __init__(self, config: dict):
+        self._config = config
+        self._lock = threading.Lock()
+        self._driver = None
+        self._root_handle = None
+
+    def start(self):
+        """Launch the shared browser. Called at API startup."""
+        with self._lock:
+            if self._driver is None:
+                logger.info('[POOL] Launching shared browser for tab mode')
+                self._driver = browser_setup.initialize_browser(self._config)
+                self._root_handle = self._driver.current_window_handle
+
+    @contextmanager
+    def acquire(self, timeout: int = 300):
+        """Yield the shared driver focused on a fresh tab for this request."""
+        acquired = self._lock.acquire(timeout=timeout)
+        if not acquired:
+            raise TimeoutError('Timed out waiting for the shared browser.')
+        try:
+            if self._driver is None:
+                logger.info('[POOL] Lazily launching shared browser for tab mode')
+                self._driver = browser_setup.initialize_browser(self._config)
+                self._root_handle = self._driver.current_window_handle
+            self._driver.switch_to.new_window('tab')
+            # Elements cached by the previous request belong to its (now
+            # closed) tab's browsing context; they must not leak into this
+            # one.
+            invalidate_element_cache(self._driver)
+            tab_handle = self._driver.current_window_handle
+            self._driver.get(self._config["meta"]["url"])
+            try:
+                yield self._driver
+            finally:
+                try:
+                    if tab_handle in self._driver.window_handles:
+                        self._driver.switch_to.window(tab_handle)
+                        self._driver.close()
+                    self._driver.switch_to.window(self._root_handle)
+                except WebDriverException as e:
+                    logger.warning(f'[POOL] Shared browser unusable after request, relaunching: {e}')
+                    try:
+                        self._driver.quit()
+                    except Exception:
+                        pass
+                    self._driver = None
+                    self._root_handle = None
+        finally:
+            self._lock.release()
+
+    def shutdown(self):
+        """Quit the shared browser. Called at API shutdown."""
+        with self._lock:
+            if self._driver is not None:
+                logger.info('[POOL] Shutting down shared browser')
+                try:
+                    self._driver.quit()
+                except Exception as e:
+                    logger.warning(f'[POOL] Error quitting shared browser during shutdown: {e}')
+                self._driver = None
+                self._root_handle = None
+
+
+def create_pool(config: dict):
+    """Build the pool implementation selected by BROWSER_POOL_MODE (pool|tabs)."""
+    mode = os.getenv("BROWSER_POOL_MODE", "pool").lower()
+    if mode == "tabs":
+        logger.info('[POOL] Using shared-browser tab mode')
+        pool = TabPool(config)
+    else:
+        pool = BrowserPool(config)
+    # Safety net for embedders without a shutdown hook (and for abrupt CLI
+    # exits): make sure pooled Firefox processes don't outlive the process.
+    atexit.register(pool.shutdown)
+    return pool
@@ -14,18 +14,85 @@ from logging_setup import setup_logging # Import setup_logging
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
 
+# Selenium talks to geckodriver over HTTP through urllib3; the default pool
+# only keeps one connection, which serializes commands and logs
+# "connection pool is full" warnings once several pooled drivers run
+# concurrently.
+WEBDRIVER_HTTP_POOL_MAXSIZE = int(os.getenv("WEBDRIVER_HTTP_POOL_MAXSIZE", "32"))
+
+# Resolved once at import; overridable for machines where geckodriver
+# lives elsewhere.
+GECKODRIVER_PATH = os.getenv("GECKODRIVER_PATH", "/usr/local/bin/geckodriver")
+
+# profile_path -> profile mtime at the moment a login check last passed.
+# While the profile directory is untouched the session cookies it holds
+# are still valid, so the (slow) on-page login check can be skipped.
+_login_verified_profiles = {}
+
+
+def _profile_mtime(profile_path: str):
+    try:
+        return os.stat(profile_path).st_mtime if profile_path else None
+    except OSError:
+        return None
+
+
+def _enlarge_webdriver_connection_pool():
+    """Raise the urllib3 pool size used for WebDriver HTTP commands."""
+    try:
+        import urllib3
+        from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+        if getattr(RemoteConnection, "_pool_patched", False):
+            return
+        if hasattr(RemoteConnection, "_get_connection_manager"):
+            # Selenium 4.x builds a PoolManager per connection instance.
+            original = RemoteConnection._get_connection_manager
+
+            def _get_connection_manager(self):
+                manager = original(self)
+                manager.connection_pool_kw["maxsize"] = WEBDRIVER_HTTP_POOL_MAXSIZE
+                manager.connection_pool_kw["block"] = False
+                return manager
+
+            RemoteConnection._get_connection_manager = _get_connection_manager
+        elif hasattr(RemoteConnection, "_conn"):
+            # Selenium 3.x keeps one shared class-level PoolManager.
+            RemoteConnection._conn = urllib3.PoolManager(
+                maxsize=WEBDRIVER_HTTP_POOL_MAXSIZE, block=False
+            )
+        else:
+            logger.warning('Could not find a RemoteConnection pool to enlarge; skipping.')
+            return
+        RemoteConnection._pool_patched = True
+        logger.info('WebDriver HTTP connection pool size set to %s', WEBDRIVER_HTTP_POOL_MAXSIZE)
+    except Exception as e:
+        logger.warning('Failed to enlarge WebDriver HTTP connection pool: %s', e)
+
+
+_enlarge_webdriver_connection_pool()
+
 def setup_firefox_profile_and_options(profile_path: str):
     """Setup Firefox with specific profile and return Options."""
-    logger.info(f'Setting up Firefox profile from: {profile_path}')
+    logger.info('Setting up Firefox profile from: %s', profile_path)
     
     options = FirefoxOptions()
     options.add_argument("--headless")
+    # The automation only needs the DOM: skip image decoding, return from
+    # driver.get() on DOMContentLoaded instead of the full load event, and
+    # turn off background chatter that costs CPU/network per driver.
+    options.page_load_strategy = 'eager'
+    options.set_preference("permissions.default.image", 2)  # do not load images
+    options.set_preference("browser.cache.disk.enable", False)
+    options.set_preference("datareporting.healthreport.uploadEnabled", False)
+    options.set_preference("app.update.auto", False)
+    options.set_preference("extensions.update.enabled", False)
     if profile_path and os.path.exists(profile_path):
         options.add_argument("-profile")
         options.add_argument(profile_path)
-        logger.info(f"Using existing Firefox profile: {profile_path}")
+        logger.info("Using existing Firefox profile: %s", profile_path)
     else:
-        logger.warning(f"Firefox profile path not found: {profile_path}. Using a new temporary profile.")
+        logger.warning("Firefox profile path not found: %s. Using a new temporary profile.", profile_path)
     
     logger.info('Firefox profile setup completed.')
     return options
@@ -39,14 +106,15 @@ def initialize_browser(config: dict):
         # Setup Firefox profile options
         options = setup_firefox_profile_and_options(config['meta']['firefox_profile_path'])
         
-        # Path to geckodriver is now expected to be in the system's PATH
-        geckodriver_path = "/usr/local/bin/geckodriver"
-        logger.info(f'Using Geckodriver from: {geckodriver_path}')
+        logger.info('Using Geckodriver from: %s', GECKODRIVER_PATH)
 
         # Initialize Firefox driver
         logger.info('Starting Firefox browser.')
-        service = FirefoxService(executable_path=geckodriver_path)
+        service = FirefoxService(executable_path=GECKODRIVER_PATH)
         driver = webdriver.Firefox(service=service, options=options)
+        # Keep implicit waits off so explicit WebDriverWait timeouts stay
+        # authoritative (implicit + explicit waits otherwise compound).
+        driver.implicitly_wait(0)
         logger.info('Firefox browser started.')
         
         # Maximize window (not needed in headless mode)
@@ -55,13 +123,22 @@ def initialize_browser(config: dict):
         
         # Navigate to the URL
         target_url = config["meta"]["url"]
-        logger.info(f'Navigating to URL: {target_url}')
+        logger.info('Navigating to URL: %s', target_url)
         driver.get(target_url)
         logger.info('Page loaded.')
         
-        # Check if login is required
-        logger.info('Checking if login is required.')
-        if login_with_persistence.check_login_required(driver, SPICE_FORM_URL): # Use SPICE_FORM_URL for check
+        # Check if login is required. If this profile already passed the
+        # check and its directory hasn't changed since, trust the stored
+        # session and skip the on-page probe.
+        profile_path = config['meta']['firefox_profile_path']
+        current_mtime = _profile_mtime(profile_path)
+        if current_mtime is not None and _login_verified_profiles.get(profile_path) == current_mtime:
+            logger.info('Profile unchanged since last verified login; skipping login check.')
+            login_needed = False
+        else:
+            logger.info('Checking if login is required.')
+            login_needed = login_with_persistence.check_login_required(driver, SPICE_FORM_URL) # Use SPICE_FORM_URL for check
+        if login_needed:
             logger.info('Login is required. Starting login process.')
             
             # Perform login using the login_with_persistence module
@@ -74,7 +151,7 @@ def initialize_browser(config: dict):
             # login_to_mca_and_verify should ideally land us there or on application history.
             # If not already on SPICE, navigate explicitly.
             if SPICE_FORM_URL not in driver.current_url:
-                logger.info(f"Not directly on SPICE form after login, navigating to {SPICE_FORM_URL}.")
+                logger.info("Not directly on SPICE form after login, navigating to %s.", SPICE_FORM_URL)
                 driver.get(SPICE_FORM_URL)
                 time.sleep(3) # Give page time to load
                 if SPICE_FORM_URL not in driver.current_url:
@@ -84,16 +161,21 @@ def initialize_browser(config: dict):
             logger.info('Login and navigation to SPICE form successful.')
         else:
             logger.info('No login required. Already on the target page or logged in.')
-        
+
+        # Remember that this profile's session worked, keyed on its mtime.
+        current_mtime = _profile_mtime(profile_path)
+        if current_mtime is not None:
+            _login_verified_profiles[profile_path] = current_mtime
+
         logger.info('Browser initialization completed.')
         return driver
     except Exception as e:
-        logger.error(f'Error during browser initialization: {str(e)}')
+        logger.error('Error during browser initialization: %s', e)
         # Ensure driver is closed if an error occurs during initialization before it's returned
         if driver:
             try:
                 driver.quit()
                 logger.info("Browser closed due to initialization error.")
             except Exception as quit_e:
-                logger.error(f"Error closing browser after initialization failure: {quit_e}")
+                logger.error("Error closing browser after initialization failure: %s", quit_e)
         raise # Re-raise the exception
\ No newline at end of file
@@ -0,0 +1,115 @@
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+
+import orjson
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+# Positive scrape results go stale as new companies/trademarks are registered,
+# so keep the default TTL modest.
+CACHE_TTL_SECONDS = int(os.getenv("NAME_CHECK_CACHE_TTL", str(6 * 3600)))
+
+# BLAKE3 is SIMD-accelerated and noticeably faster than SHA-256 on large
+# payloads; fall back to hashlib when the optional dependency is missing.
+try:
+    from blake3 import blake3 as _blake3
+
+    def _digest(data: bytes) -> str:
+        return _blake3(data).hexdigest()
+except ImportError:
+    def _digest(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+_PUNCTUATION_RE = re.compile(r"[^A-Z0-9 ]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_company_name(name: str) -> str:
+    """
+    Normalize a company name for cache keying: uppercase, strip punctuation,
+    collapse whitespace. "Acme Pvt. Ltd" and "ACME PVT LTD" share an entry.
+    """
+    name = _PUNCTUATION_RE.sub(" ", name.upper())
+    return _WHITESPACE_RE.sub(" ", name).strip()
+
+
+class RedisCache:
+    """
+    Small Redis-backed cache for name-check results, keyed by a hash of the
+    request payload. If redis is not installed or unreachable the cache
+    degrades to an in-process dict with the same TTL semantics, so the API
+    keeps working on hosts without Redis.
+    """
+
+    def __init__(self, url: str = REDIS_URL):
+        self._url = url
+        self._cli = None
+        self._checked = False  # becomes True once connectivity has been probed
+        self._local = {}  # key -> (expires_at, value) fallback store
+        self._local_lock = threading.Lock()
+
+    def _client(self):
+        """
+        Lazily create the Redis client on first use instead of pinging at
+        construction time, so importing an API module never blocks on a
+        connection attempt. The first get/set decides whether Redis is
+        usable; after that the decision is a flag check.
+        """
+        if not self._checked:
+            self._checked = True
+            try:
+                import redis
+                self._cli = redis.Redis.from_url(
+                    self._url, decode_responses=True, socket_connect_timeout=1
+                )
+                self._cli.ping()
+                logger.info(f'[CACHE] Connected to Redis at {self._url}')
+            except Exception as e:
+                logger.warning(f'[CACHE] Redis unavailable ({e}); using in-process cache.')
+                self._cli = None
+        return self._cli
+
+    def _hash_payload(self, payload: dict) -> str:
+        digest = _digest(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS))
+        return f"name_check:{digest}"
+
+    def get(self, payload: dict):
+        """Return the cached value for a payload, or None on miss/error."""
+        key = self._hash_payload(payload)
+        cli = self._client()
+        try:
+            if cli is not None:
+                raw = cli.get(key)
+                return orjson.loads(raw) if raw is not None else None
+        except Exception as e:
+            logger.warning(f'[CACHE] Redis get failed: {e}')
+            return None
+        with self._local_lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._local[key]
+                return None
+            return value
+
+    def set(self, payload: dict, value, ttl: int = CACHE_TTL_SECONDS):
+        """Store a value for a payload with the given TTL. Errors are logged, not raised."""
+        key = self._hash_payload(payload)
+        cli = self._client()
+        try:
+            if cli is not None:
+                cli.setex(key, ttl, orjson.dumps(value).decode())
+                return
+        except Exception as e:
+            logger.warning(f'[CACHE] Redis set failed: {e}')
+            return
+        with self._local_lock:
+            self._local[key] = (time.time() + ttl, value)
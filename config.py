@@ -1,8 +1,32 @@
+import functools
 import os
-from selenium.webdriver.common.by import By
+from types import SimpleNamespace
 from dotenv import load_dotenv
 
-load_dotenv()
+# W3C locator strategy strings, as accepted directly by find_element(by, value).
+# Using the literals instead of selenium's By aliases (By.ID is just "id")
+# keeps config importable without paying the selenium import for callers that
+# only need constants.
+BY_ID = "id"
+BY_XPATH = "xpath"
+BY_CSS = "css selector"
+BY_CLASS_NAME = "class name"
+
+# Sentinel marking that .env has been parsed into this process's environment.
+# An lru_cache would not survive a reloader that re-executes the module (it
+# gets a fresh module object and a fresh cache); the environ flag does.
+_ENV_LOADED_SENTINEL = "_NAME_CHECK_DOTENV_LOADED"
+
+
+def _load_env() -> None:
+    """Parse .env into os.environ once per process, even across re-imports."""
+    if os.environ.get(_ENV_LOADED_SENTINEL):
+        return
+    load_dotenv()
+    os.environ[_ENV_LOADED_SENTINEL] = "1"
+
+
+_load_env()
 
 # --- URLs ---
 LOGIN_URL = "https://www.mca.gov.in/content/mca/global/en/foportal/fologin.html"
@@ -22,58 +46,88 @@ DEFAULT_RETRIES = 3
 # --- Element Locators ---
 ELEMENTS = {
     # Main Form (Part A) - General
-    "OK_BUTTON_POPUP": (By.ID, "guideContainer-rootPanel-modal_container_copy-panel-guidebutton_65123201___widget"),
-    "MODAL_BACKDROP": (By.CLASS_NAME, "modal-backdrop"),
+    "OK_BUTTON_POPUP": (BY_ID, "guideContainer-rootPanel-modal_container_copy-panel-guidebutton_65123201___widget"),
+    "MODAL_BACKDROP": (BY_CLASS_NAME, "modal-backdrop"),
 
     # Company Type Selection
-    "COMPANY_TYPE_DROPDOWN": (By.ID, "guideContainer-rootPanel-panel_2017717670_cop-panel-guidedropdownlist___widget"),
+    "COMPANY_TYPE_DROPDOWN": (BY_ID, "guideContainer-rootPanel-panel_2017717670_cop-panel-guidedropdownlist___widget"),
 
     # Company Class Selection
-    "COMPANY_CLASS_DROPDOWN": (By.ID, "guideContainer-rootPanel-panel_2017717670_cop-panel-guidedropdownlist_co___widget"),
+    "COMPANY_CLASS_DROPDOWN": (BY_ID, "guideContainer-rootPanel-panel_2017717670_cop-panel-guidedropdownlist_co___widget"),
 
     # Company Category Selection
-    "COMPANY_CATEGORY_DROPDOWN": (By.ID, "guideContainer-rootPanel-panel_2017717670_cop-panel-guidedropdownlist_co_1813708729___widget"),
+    "COMPANY_CATEGORY_DROPDOWN": (BY_ID, "guideContainer-rootPanel-panel_2017717670_cop-panel-guidedropdownlist_co_1813708729___widget"),
 
     # Company Sub-Category Selection
-    "COMPANY_SUB_CATEGORY_DROPDOWN": (By.ID, "guideContainer-rootPanel-panel_2017717670_cop-panel-guidedropdownlist_co_175619313___widget"),
+    "COMPANY_SUB_CATEGORY_DROPDOWN": (BY_ID, "guideContainer-rootPanel-panel_2017717670_cop-panel-guidedropdownlist_co_175619313___widget"),
 
     # NIC Code Selection
-    "NIC_BUTTON": (By.ID, "guideContainer-rootPanel-panel_2017717670_cop-panel-panel_1663114232_cop-panel_1119548299-panel-mca_button_v2___widget"),
-    "NIC_SEARCH_BAR": (By.ID, "guideContainer-rootPanel-panel_2017717670_cop-panel-panel_1663114232_cop-modal_container_1602-panel-panel-guidetextbox___widget"),
-    "NIC_PAGE_SIZE_DROPDOWN": (By.ID, "guideContainer-rootPanel-panel_2017717670_cop-panel-panel_1663114232_cop-modal_container_1602-panel-customdropdown___widget"),
+    "NIC_BUTTON": (BY_ID, "guideContainer-rootPanel-panel_2017717670_cop-panel-panel_1663114232_cop-panel_1119548299-panel-mca_button_v2___widget"),
+    "NIC_SEARCH_BAR": (BY_ID, "guideContainer-rootPanel-panel_2017717670_cop-panel-panel_1663114232_cop-modal_container_1602-panel-panel-guidetextbox___widget"),
+    "NIC_PAGE_SIZE_DROPDOWN": (BY_ID, "guideContainer-rootPanel-panel_2017717670_cop-panel-panel_1663114232_cop-modal_container_1602-panel-customdropdown___widget"),
     "NIC_CHECKBOX_XPATH": "//input[@type='checkbox' and @value='{}']", # Formattable string for dynamic value
-    "NIC_ADD_BUTTON": (By.ID, "guideContainer-rootPanel-panel_2017717670_cop-panel-panel_1663114232_cop-modal_container_1602-panel-panel-guidebutton___widget"),
+    "NIC_ADD_BUTTON": (BY_ID, "guideContainer-rootPanel-panel_2017717670_cop-panel-panel_1663114232_cop-modal_container_1602-panel-panel-guidebutton___widget"),
 
     # Company Name Input
-    "COMPANY_NAME_INPUT": (By.ID, "guideContainer-rootPanel-panel_2017717670_cop-panel_copy-panel-panel-guidetextbox_1884163___widget"),
-    "AUTO_CHECK_BUTTON": (By.ID, "guideContainer-rootPanel-panel_copy_222446296-guidebutton_copy_748_1005506464___widget"),
+    "COMPANY_NAME_INPUT": (BY_ID, "guideContainer-rootPanel-panel_2017717670_cop-panel_copy-panel-panel-guidetextbox_1884163___widget"),
+    "AUTO_CHECK_BUTTON": (BY_ID, "guideContainer-rootPanel-panel_copy_222446296-guidebutton_copy_748_1005506464___widget"),
 
     # Post Name-Check Actions
-    "PROCEED_INCORPORATION_RADIO": (By.CSS_SELECTOR, "input[type='radio'][id='option2']"),
-    "CONTINUE_BUTTON": (By.ID, "guideContainer-rootPanel-panel_copy-modal_container-panel-guidebutton_65123201___widget"),
+    "PROCEED_INCORPORATION_RADIO": (BY_CSS, "input[type='radio'][id='option2']"),
+    "CONTINUE_BUTTON": (BY_ID, "guideContainer-rootPanel-panel_copy-modal_container-panel-guidebutton_65123201___widget"),
 
     # Login Page Elements
-    "LOGIN_INITIAL_OK_BUTTON": (By.XPATH, "//button[@class='btn btn-primary' and @data-dismiss='modal' and contains(text(), 'OK')]"),
+    "LOGIN_INITIAL_OK_BUTTON": (BY_CSS, "button.btn.btn-primary[data-dismiss='modal']"),  # CSS: Gecko matches it much faster than the old text()-XPath
     "LOGIN_USER_ID_FIELD_XPATH": "//input[@type='text']", # Primary XPath
     "LOGIN_USER_ID_FIELD_PLACEHOLDER_XPATH": "//input[contains(@placeholder,'User ID')]", # Fallback
     "LOGIN_USER_ID_FIELD_NAME_XPATH": "//input[contains(@name,'userId')]", # Fallback
-    "LOGIN_PASSWORD_FIELD": (By.CSS_SELECTOR, "input[type='password']"),
-    "LOGIN_CAPTCHA_IMAGE": (By.CSS_SELECTOR, "img[src*='captcha']"),
-    "LOGIN_CAPTCHA_INPUT": (By.ID, "customCaptchaInput"),
-    "LOGIN_BUTTON": (By.XPATH, "//button[contains(text(),'Login') or @type='submit']"),
-    "LOGIN_ERROR_MESSAGE": (By.CSS_SELECTOR, ".alert-danger"),
-    "LOGIN_CAPTCHA_REFRESH_BUTTON": (By.ID, "refresh-img"),
-    "LOGIN_POPUP_XPATH": (By.XPATH, "/html/body/div[2]/div/div[2]/div/div/div/div[2]/button"), # From login_with_persistence
-    "LOGIN_FORM_SUBMIT_BUTTON": (By.ID, "guideContainer-rootPanel-panel_1846244155-submit___widget"), # From login_with_persistence
-    "LOGIN_CAPTCHA_ERROR_MESSAGE_ID": (By.ID, "showResult"), # From login_with_persistence
-    "LOGIN_USER_FIELD_ID": (By.ID, "guideContainer-rootPanel-panel_1846244155-guidetextbox___widget"),
-    "LOGIN_PASSWORD_FIELD_ID": (By.ID, "guideContainer-rootPanel-panel_1846244155-guidepasswordbox___widget"),
+    "LOGIN_PASSWORD_FIELD": (BY_CSS, "input[type='password']"),
+    "LOGIN_CAPTCHA_IMAGE": (BY_CSS, "img[src*='captcha']"),
+    "LOGIN_CAPTCHA_INPUT": (BY_ID, "customCaptchaInput"),
+    "LOGIN_BUTTON": (BY_CSS, "button[type='submit']"),  # CSS: the submit attribute alone identifies it on the login page
+    "LOGIN_ERROR_MESSAGE": (BY_CSS, ".alert-danger"),
+    "LOGIN_CAPTCHA_REFRESH_BUTTON": (BY_ID, "refresh-img"),
+    "LOGIN_POPUP_XPATH": (BY_XPATH, "/html/body/div[2]/div/div[2]/div/div/div/div[2]/button"), # From login_with_persistence
+    "LOGIN_FORM_SUBMIT_BUTTON": (BY_ID, "guideContainer-rootPanel-panel_1846244155-submit___widget"), # From login_with_persistence
+    "LOGIN_CAPTCHA_ERROR_MESSAGE_ID": (BY_ID, "showResult"), # From login_with_persistence
+    "LOGIN_USER_FIELD_ID": (BY_ID, "guideContainer-rootPanel-panel_1846244155-guidetextbox___widget"),
+    "LOGIN_PASSWORD_FIELD_ID": (BY_ID, "guideContainer-rootPanel-panel_1846244155-guidepasswordbox___widget"),
     
     # Scrape Tabs Elements
-    "ERROR_TAB": (By.XPATH, "//a[.//span[text()='Errors/Info']]"),
-    "NAME_SIMILARITY_TAB": (By.XPATH, "//a[.//span[text()='Name Similarity Alerts']]"),
-    "TRADEMARK_TAB": (By.ID, "guideContainer-rootPanel-panel_2017717670_cop-panel_672096424-panel_copy-panel1629804157135___guide-item-nav"),
-    "ERROR_TABLE": (By.ID, "errorTable"),
-    "NAME_SIMILARITY_TABLE": (By.ID, "nameSimilarityAlertsTable"),
-    "TRADEMARK_TABLE": (By.ID, "guideContainer-rootPanel-panel_2017717670_cop-panel_672096424-panel_copy-panel1629804157135__")
-}
\ No newline at end of file
+    "ERROR_TAB": (BY_XPATH, "//a[.//span[text()='Errors/Info']]"),
+    "NAME_SIMILARITY_TAB": (BY_XPATH, "//a[.//span[text()='Name Similarity Alerts']]"),
+    "TRADEMARK_TAB": (BY_ID, "guideContainer-rootPanel-panel_2017717670_cop-panel_672096424-panel_copy-panel1629804157135___guide-item-nav"),
+    "ERROR_TABLE": (BY_ID, "errorTable"),
+    "NAME_SIMILARITY_TABLE": (BY_ID, "nameSimilarityAlertsTable"),
+    "TRADEMARK_TABLE": (BY_ID, "guideContainer-rootPanel-panel_2017717670_cop-panel_672096424-panel_copy-panel1629804157135__")
+}
+
+# Attribute-style view of the same locators: E.OK_BUTTON_POPUP is a single
+# LOAD_ATTR instead of a dict hash+compare, which matters inside the retry
+# loops that re-read locators on every iteration. The ELEMENTS dict stays as
+# the canonical definition (and for callers that build keys dynamically).
+E = SimpleNamespace(**ELEMENTS)
+
+# Reverse map for diagnostics: locator tuple -> its ELEMENTS key, so error
+# screenshots are named after the readable key ("LOGIN_BUTTON") instead of a
+# 90-character widget ID, and the lookup is one dict hit rather than string
+# formatting on the hot error path.
+_LOCATOR_NAMES = {
+    locator: name for name, locator in ELEMENTS.items() if isinstance(locator, tuple)
+}
+
+
+def locator_short_name(locator: tuple) -> str:
+    """Readable name for a locator; dynamic locators fall back to their value."""
+    return _LOCATOR_NAMES.get(locator) or str(locator[1])
+
+
+# %-template mirror of ELEMENTS["NIC_CHECKBOX_XPATH"]: str.__mod__ beats
+# .format for a single placeholder, and the cache makes repeats free anyway.
+_NIC_CHECKBOX_XPATH_TEMPLATE = "//input[@type='checkbox' and @value='%s']"
+
+
+@functools.lru_cache(maxsize=4096)
+def nic_checkbox_locator(code: str) -> tuple:
+    """Formatted NIC checkbox locator, built once per distinct code."""
+    return (BY_XPATH, _NIC_CHECKBOX_XPATH_TEMPLATE % code)
\ No newline at end of file
@@ -0,0 +1,123 @@
+import logging
+
+from preprocessor import simplify_trademarks
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+# Severities in the Errors/Info tab that do NOT block a name. Anything else
+# (e.g. "Error") means the portal rejected the proposed name.
+NON_BLOCKING_SEVERITIES = {"info"}
+
+# How many similar names / trademark words to keep in ranked summaries.
+TOP_CANDIDATES = 8
+
+# rapidfuzz ranks a few hundred candidates in well under a millisecond;
+# difflib is a slower but dependency-free stand-in.
+try:
+    from rapidfuzz import fuzz
+
+    def _similarity(base: str, candidate: str) -> float:
+        return fuzz.token_set_ratio(base, candidate)
+except ImportError:
+    from difflib import SequenceMatcher
+
+    def _similarity(base: str, candidate: str) -> float:
+        return SequenceMatcher(None, base.lower(), candidate.lower()).ratio() * 100
+
+
+def rank_candidates(base_name: str, candidates: list, limit: int = TOP_CANDIDATES) -> list:
+    """
+    Return the `limit` candidates most similar to base_name, most similar
+    first. Keeping only the relevant conflicts beats a blind [:N] slice,
+    which can drop the closest match while keeping unrelated ones.
+    """
+    ranked = sorted(candidates, key=lambda c: _similarity(base_name, c), reverse=True)
+    return ranked[:limit]
+
+
+class ConflictAnalyser:
+    """
+    Derives a verdict from the tab data returned by scrape_all_tabs.
+
+    All derived fields (blocking flag, conflict messages, similar names,
+    trademark words) are computed in a single pass over each scraped table
+    at construction time, so the accessors are plain reads no matter how
+    often they are called or how large the MCA payload is.
+    """
+
+    def __init__(self, scraped: dict):
+        # scrape_all_tabs reports a tab it could not scrape as None; for the
+        # errors tab that is not the same as a clean tab, since the errors
+        # alone decide the verdict. Track it so verdict can say UNKNOWN
+        # instead of wrongly declaring the name VALID.
+        self._errors_scraped = scraped.get("error") is not None
+        self.errors = scraped.get("error") or []
+        self.name_similarity = scraped.get("name_similarity") or []
+        self.trademarks = scraped.get("trademark") or []
+
+        self._blocking = False
+        self._blocking_messages = []
+        self._info_messages = []
+        for row in self.errors:
+            if not row:
+                continue
+            severity = row[0].strip().lower() if row[0] else ""
+            message = row[-1] if len(row) > 1 else row[0]
+            if severity in NON_BLOCKING_SEVERITIES:
+                self._info_messages.append(message)
+            else:
+                self._blocking = True
+                self._blocking_messages.append(message)
+
+        self._similar_names = [row[0] for row in self.name_similarity if row and row[0]]
+        self._trademark_words = simplify_trademarks(
+            [row[0] for row in self.trademarks if row and row[0]]
+        )
+
+    def has_blocking_error(self) -> bool:
+        """True if the Errors/Info tab contained any non-informational row."""
+        return self._blocking
+
+    def conflict_messages(self) -> list:
+        """All messages from the Errors/Info tab, blocking first."""
+        return self._blocking_messages + self._info_messages
+
+    def raw_blocking_messages(self) -> list:
+        """Only the messages whose severity blocks the proposed name."""
+        return self._blocking_messages[:]
+
+    def similar_names(self) -> list:
+        """Company/LLP names flagged in the Name Similarity Alerts tab."""
+        return self._similar_names[:]
+
+    def trademark_words(self) -> list:
+        """Trademark words flagged in the Trademark tab."""
+        return self._trademark_words[:]
+
+    @property
+    def verdict(self) -> str:
+        if self._blocking:
+            return "NOT VALID"
+        return "VALID" if self._errors_scraped else "UNKNOWN"
+
+    def summary(self, base_name: str = None) -> dict:
+        """
+        Compact analysis payload suitable for an API response.
+
+        When base_name is given, similar names and trademark words are ranked
+        by similarity to it and truncated to the TOP_CANDIDATES most relevant
+        entries; otherwise the full lists are returned.
+        """
+        similar = self.similar_names()
+        trademarks = self.trademark_words()
+        if base_name:
+            similar = rank_candidates(base_name, similar)
+            trademarks = rank_candidates(base_name, trademarks)
+        return {
+            "verdict": self.verdict,
+            "blocking_messages": self.raw_blocking_messages(),
+            "info_messages": self._info_messages[:],
+            "similar_names": similar,
+            "trademark_words": trademarks,
+        }
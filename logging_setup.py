@@ -1,9 +1,23 @@
+import atexit
 import os
 import logging
+from logging.handlers import MemoryHandler
 from datetime import datetime
 
+# Path of the log file chosen by the first setup_logging call. Later calls
+# (api.py and main.py both invoke it at import) return this instead of
+# attaching another FileHandler/StreamHandler pair, which would duplicate
+# every log line's I/O.
+_configured_log_file = None
+
 def setup_logging(api_mode=False):
-    """Setup logging configuration. If api_mode is True, use a fixed log file name."""
+    """Setup logging configuration. If api_mode is True, use a fixed log file name.
+
+    Idempotent: only the first call configures handlers; repeats are no-ops.
+    """
+    global _configured_log_file
+    if _configured_log_file is not None:
+        return _configured_log_file
     if not os.path.exists('logs'):
         os.makedirs('logs')
     if api_mode:
@@ -11,13 +25,22 @@ def setup_logging(api_mode=False):
     else:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         log_file = f'logs/automation_{timestamp}.log'
+    # The retry-heavy login/scrape paths log every iteration; buffering the
+    # file handler batches those write() syscalls, flushing every 1024
+    # records, on any ERROR, and at exit so crash diagnostics are kept.
+    file_handler = logging.FileHandler(log_file, delay=True)
+    buffered_handler = MemoryHandler(
+        capacity=1024, flushLevel=logging.ERROR, target=file_handler
+    )
+    atexit.register(buffered_handler.flush)
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s [%(levelname)s] %(message)s',
         handlers=[
-            logging.FileHandler(log_file),
+            buffered_handler,
             logging.StreamHandler()
         ]
     )
     logging.info('Started logging')
-    return log_file 
\ No newline at end of file
+    _configured_log_file = log_file
+    return log_file
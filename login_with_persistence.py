@@ -1,9 +1,8 @@
 import os
-import time
 import base64
-import json
 import requests
 import logging
+from weakref import WeakKeyDictionary
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
@@ -13,13 +12,14 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 
 from config import (
-    LOGIN_URL, APPLICATION_HISTORY_URL, MCA_HOME_URL, ELEMENTS,
+    LOGIN_URL, APPLICATION_HISTORY_URL, MCA_HOME_URL, E,
     TRUECAPTCHA_USER, TRUECAPTCHA_KEY, DEFAULT_TIMEOUT, DEFAULT_RETRIES
 )
 from selenium_utils import (
     _save_screenshot_on_error, _wait_for_element_clickable, _send_text,
     _click_element, _force_click_js, _solve_captcha_with_api,
-    AutomationError, VerificationStepFailed, _wait_for_element_presence
+    AutomationError, VerificationStepFailed, _wait_for_element_presence,
+    invalidate_element_cache
 )
 from logging_setup import setup_logging # Import the setup_logging function
 
@@ -28,15 +28,53 @@ from logging_setup import setup_logging # Import the setup_logging function
 logger = logging.getLogger(__name__)
 
 # --- Helper Functions ---
+# Resolves a batch of locators inside the browser; Selenium wraps returned
+# DOM nodes as WebElements, so the whole locator phase costs one round-trip.
+_BULK_FIND_JS = """
+var locs = arguments[0];
+return locs.map(function (l) {
+    if (l.by === 'id') { return document.getElementById(l.value); }
+    if (l.by === 'xpath') {
+        return document.evaluate(l.value, document, null,
+                                 XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    if (l.by === 'css selector') { return document.querySelector(l.value); }
+    return null;
+});
+"""
+
+def bulk_find(driver: webdriver.Firefox, locators: dict) -> dict:
+    """Resolve several (By, value) locators in one execute_script call.
+
+    Returns a dict of key -> WebElement (or None for anything not found or
+    located by an unsupported strategy); callers fall back to the per-locator
+    helpers for missing entries.
+    """
+    keys = list(locators)
+    payload = [{"by": locators[k][0], "value": locators[k][1]} for k in keys]
+    found = driver.execute_script(_BULK_FIND_JS, payload)
+    return dict(zip(keys, found))
+
+# Resolves the instant the load event fires (or immediately when the page is
+# already complete) in a single async-script round-trip, instead of polling
+# readyState over HTTP every half second.
+_DOM_READY_JS = """
+var timeoutMs = arguments[0];
+var done = arguments[arguments.length - 1];
+if (document.readyState === 'complete') { done(true); return; }
+window.addEventListener('load', function () { done(true); }, { once: true });
+setTimeout(function () { done(document.readyState === 'complete'); }, timeoutMs);
+"""
+
 def wait_for_dom_ready(driver: webdriver.Firefox, timeout: int = DEFAULT_TIMEOUT):
     """Waits for the page's document.readyState to be 'complete'."""
     logger.info("Waiting for page DOM to be ready...")
     try:
-        WebDriverWait(driver, timeout).until(
-            lambda d: d.execute_script("return document.readyState") == "complete"
-        )
-        logger.info("Page DOM is ready.")
-        return True
+        driver.set_script_timeout(timeout + 1)
+        if driver.execute_async_script(_DOM_READY_JS, timeout * 1000):
+            logger.info("Page DOM is ready.")
+            return True
+        raise TimeoutException(f"readyState not 'complete' within {timeout}s")
     except TimeoutException:
         current_state = "unknown"
         try:
@@ -47,50 +85,77 @@ def wait_for_dom_ready(driver: webdriver.Firefox, timeout: int = DEFAULT_TIMEOUT
         _save_screenshot_on_error(driver, logger, "dom_not_ready_timeout")
         return False
 
+def _refresh_captcha_and_wait(driver: webdriver.Firefox, timeout: int = 5):
+    """Click the captcha refresh button and wait for the new image to render.
+
+    Waits on staleness of the old <img> (the portal swaps the node) and then
+    visibility of the new one, so the retry loop resumes the moment the fresh
+    captcha is on screen instead of after a fixed sleep.
+    """
+    try:
+        old_img = driver.find_element(*E.LOGIN_CAPTCHA_IMAGE)
+    except NoSuchElementException:
+        old_img = None
+    _click_element(driver, logger, E.LOGIN_CAPTCHA_REFRESH_BUTTON, timeout=timeout)
+    try:
+        if old_img is not None:
+            WebDriverWait(driver, timeout).until(EC.staleness_of(old_img))
+        WebDriverWait(driver, timeout).until(
+            EC.visibility_of_element_located(E.LOGIN_CAPTCHA_IMAGE)
+        )
+    except TimeoutException:
+        logger.warning(f"Captcha image did not visibly refresh within {timeout}s; continuing.")
+
 def handle_captcha_on_page(driver: webdriver.Firefox, max_attempts: int = DEFAULT_RETRIES):
     """Handle captcha on the website with retry logic"""
     logger.info("Handling CAPTCHA on page using selenium_utils...")
     attempt = 0
+    fetch_by_url = True
 
     while attempt < max_attempts:
         logger.info(f"CAPTCHA attempt {attempt + 1} of {max_attempts}")
         try:
             # Solve CAPTCHA using the utility function
-            captcha_solved_successfully = _solve_captcha_with_api(driver, logger)
+            captcha_solved_successfully = _solve_captcha_with_api(driver, logger, fetch_by_url=fetch_by_url)
 
             if captcha_solved_successfully:
                 # Click submit button after entering CAPTCHA
-                _click_element(driver, logger, ELEMENTS["LOGIN_FORM_SUBMIT_BUTTON"])
+                _click_element(driver, logger, E.LOGIN_FORM_SUBMIT_BUTTON)
                 logger.info("Clicked submit after entering CAPTCHA.")
                 wait_for_dom_ready(driver, timeout=7) # Wait for page to potentially reload or show error
 
-                try:
-                    # Check for immediate 'incorrect captcha' error message
-                    error_message_element = _wait_for_element_presence(driver, logger, ELEMENTS["LOGIN_CAPTCHA_ERROR_MESSAGE_ID"], timeout=2)
-                    if error_message_element.is_displayed() and "The captcha entered is incorrect" in error_message_element.text:
-                        logger.warning("CAPTCHA incorrect. Refreshing...")
-                        _send_text(driver, logger, ELEMENTS["LOGIN_CAPTCHA_INPUT"], "", clear_first=True) # Clear input
-                        _click_element(driver, logger, ELEMENTS["LOGIN_CAPTCHA_REFRESH_BUTTON"])
-                        time.sleep(2)
-                        continue
-                    else:
-                        logger.info("CAPTCHA submitted, no immediate 'incorrect captcha' error found.")
-                        return True
-                except TimeoutException: # Error message element not found, likely moved past
+                # Presence, visibility and text of the error element come
+                # back in one script call instead of a presence wait plus
+                # is_displayed() and .text round-trips.
+                info = driver.execute_script(
+                    "var e = document.getElementById(arguments[0]);"
+                    " return e ? {v: e.offsetParent !== null, t: e.innerText} : null;",
+                    E.LOGIN_CAPTCHA_ERROR_MESSAGE_ID[1],
+                )
+                if info is None:
                     logger.info("No CAPTCHA error message element found. Assuming CAPTCHA was accepted or page changed.")
                     return True
+                if info["v"] and "The captcha entered is incorrect" in info["t"]:
+                    logger.warning("CAPTCHA incorrect. Refreshing...")
+                    # A wrong answer may mean the src endpoint served a
+                    # different image than the page shows; screenshot the
+                    # displayed captcha from here on.
+                    fetch_by_url = False
+                    _send_text(driver, logger, E.LOGIN_CAPTCHA_INPUT, "", clear_first=True) # Clear input
+                    _refresh_captcha_and_wait(driver)
+                    continue
+                logger.info("CAPTCHA submitted, no immediate 'incorrect captcha' error found.")
+                return True
             else:
                 logger.warning("CAPTCHA API did not return text or failed to solve. Refreshing CAPTCHA on page.")
-                _click_element(driver, logger, ELEMENTS["LOGIN_CAPTCHA_REFRESH_BUTTON"])
-                time.sleep(2)
+                _refresh_captcha_and_wait(driver)
                 attempt += 1
         except (TimeoutException, NoSuchElementException) as e:
             logger.error(f"CAPTCHA element not found or not interactable: {e}.")
             _save_screenshot_on_error(driver, logger, "captcha_elements_missing")
             # Attempt to refresh if refresh button is present
             try:
-                _click_element(driver, logger, ELEMENTS["LOGIN_CAPTCHA_REFRESH_BUTTON"], timeout=3)
-                time.sleep(2)
+                _refresh_captcha_and_wait(driver, timeout=3)
             except Exception as refresh_e:
                 logger.warning(f"Could not refresh CAPTCHA after missing element: {refresh_e}")
             attempt += 1
@@ -101,11 +166,9 @@ def handle_captcha_on_page(driver: webdriver.Firefox, max_attempts: int = DEFAUL
             attempt += 1
             if attempt < max_attempts:
                 try:
-                    _click_element(driver, logger, ELEMENTS["LOGIN_CAPTCHA_REFRESH_BUTTON"], timeout=3)
-                    time.sleep(2)
+                    _refresh_captcha_and_wait(driver, timeout=3)
                 except Exception as refresh_e:
                     logger.warning(f"Could not refresh CAPTCHA after general error: {refresh_e}")
-            time.sleep(1)
     logger.error("Max CAPTCHA attempts reached without successful submission.")
     return False
 
@@ -117,13 +180,15 @@ def close_initial_popup_option_b(driver: webdriver.Firefox, max_close_attempts:
     for attempt in range(max_close_attempts):
         logger.info(f"Attempting to close pop-up and verify absence (Attempt {attempt + 1} of {max_close_attempts})...")
         try:
-            _click_element(driver, logger, ELEMENTS["LOGIN_POPUP_XPATH"], timeout=3) # Use utility click
+            _click_element(driver, logger, E.LOGIN_POPUP_XPATH, timeout=3) # Use utility click
             logger.info(f"Clicked pop-up element on attempt {attempt + 1}.")
-            time.sleep(0.5)
 
             try:
-                WebDriverWait(driver, 2).until_not(
-                    EC.presence_of_element_located(ELEMENTS["LOGIN_POPUP_XPATH"])
+                # One invisibility wait with the combined budget of the old
+                # 0.5s sleep + 2s presence check; returns as soon as the
+                # pop-up is gone.
+                WebDriverWait(driver, 2.5).until(
+                    EC.invisibility_of_element_located(E.LOGIN_POPUP_XPATH)
                 )
                 logger.info("Pop-up successfully closed (element no longer present).")
                 return True
@@ -140,12 +205,12 @@ def close_initial_popup_option_b(driver: webdriver.Firefox, max_close_attempts:
             logger.info(f"Pop-up element not found or not clickable on attempt {attempt + 1}. Assuming pop-up is not an issue.")
             try:
                 WebDriverWait(driver, 1).until_not(
-                     EC.presence_of_element_located(ELEMENTS["LOGIN_POPUP_XPATH"])
+                     EC.presence_of_element_located(E.LOGIN_POPUP_XPATH)
                 )
                 logger.info("Confirmed: Pop-up element is not present.")
                 return True
             except TimeoutException:
-                logger.warning(f"Pop-up element (e.g. close button) was not initially clickable/found in attempt {attempt +1}, but an element matching XPath '{ELEMENTS['LOGIN_POPUP_XPATH'][1]}' is still present.")
+                logger.warning(f"Pop-up element (e.g. close button) was not initially clickable/found in attempt {attempt +1}, but an element matching XPath '{E.LOGIN_POPUP_XPATH[1]}' is still present.")
                 if attempt < max_close_attempts - 1:
                     continue
                 else:
@@ -196,7 +261,16 @@ def login_to_mca_and_verify(driver: webdriver.Firefox, config: dict):
 
     try:
         driver.get(LOGIN_URL)
+        invalidate_element_cache(driver)
         logger.info(f"Navigated to login page: {LOGIN_URL}")
+
+        # A live session redirects straight to application history; that one
+        # cheap URL string check lets us skip the DOM-ready wait and the whole
+        # form flow.
+        if APPLICATION_HISTORY_URL in driver.current_url:
+            logger.info("Redirected to application history; session already authenticated.")
+            return driver, True
+
         wait_for_dom_ready(driver) # Wait for page to be ready
 
         # --- Check for homepage redirect ---
@@ -206,6 +280,7 @@ def login_to_mca_and_verify(driver: webdriver.Firefox, config: dict):
         if MCA_HOME_URL in current_url_after_get:
             logger.info(f"Detected landing on MCA homepage ('{MCA_HOME_URL}'). Attempting to navigate directly to Application History.")
             driver.get(APPLICATION_HISTORY_URL)
+            invalidate_element_cache(driver)
             logger.info(f"Navigated to Application History page: {APPLICATION_HISTORY_URL}")
             wait_for_dom_ready(driver) # Allow application history page to load
             perform_form_login = False # Skip form login steps
@@ -220,7 +295,7 @@ def login_to_mca_and_verify(driver: webdriver.Firefox, config: dict):
             try:
                 # Wait for the CAPTCHA image to be visible before proceeding
                 logger.info("Waiting for login page to be ready by checking for CAPTCHA image...")
-                _wait_for_element_presence(driver, logger, ELEMENTS["LOGIN_CAPTCHA_IMAGE"])
+                _wait_for_element_presence(driver, logger, E.LOGIN_CAPTCHA_IMAGE)
                 logger.info("Login page is ready. Proceeding to fill details.")
 
                 logger.info("Attempting to fill login details...")
@@ -237,11 +312,29 @@ def login_to_mca_and_verify(driver: webdriver.Firefox, config: dict):
                     _save_screenshot_on_error(driver, logger, "missing_credentials")
                     return driver, False
                 
-                _send_text(driver, logger, ELEMENTS["LOGIN_USER_FIELD_ID"], username)
-                logger.info("Entered Login ID.")
+                # Resolve both fields in one round-trip and type into them
+                # directly; the locator-by-locator helpers remain the
+                # fallback if either is missing or has gone stale.
+                try:
+                    handles = bulk_find(driver, {
+                        "user": E.LOGIN_USER_FIELD_ID,
+                        "password": E.LOGIN_PASSWORD_FIELD_ID,
+                    })
+                    if handles["user"] is None or handles["password"] is None:
+                        raise NoSuchElementException("Login fields not found by bulk_find.")
+                    handles["user"].clear()
+                    handles["user"].send_keys(username)
+                    logger.info("Entered Login ID.")
+                    handles["password"].clear()
+                    handles["password"].send_keys(password)
+                    logger.info("Entered Password.")
+                except (NoSuchElementException, StaleElementReferenceException) as bulk_e:
+                    logger.warning(f"Bulk login-field fill failed ({bulk_e}); using per-field helpers.")
+                    _send_text(driver, logger, E.LOGIN_USER_FIELD_ID, username)
+                    logger.info("Entered Login ID.")
 
-                _send_text(driver, logger, ELEMENTS["LOGIN_PASSWORD_FIELD_ID"], password)
-                logger.info("Entered Password.")
+                    _send_text(driver, logger, E.LOGIN_PASSWORD_FIELD_ID, password)
+                    logger.info("Entered Password.")
             except TimeoutException:
                 logger.error("Timeout waiting for login ID or Password field. Check element IDs.")
                 _save_screenshot_on_error(driver, logger, "login_fields_timeout")
@@ -262,10 +355,15 @@ def login_to_mca_and_verify(driver: webdriver.Firefox, config: dict):
         if check_login_success_url_only(driver):
             logger.info("MCA Login Successful!")
             login_successful = True
+            # Decisions cached while logged out no longer hold.
+            _login_required_cache.pop(driver, None)
         else:
             logger.error("MCA Login Failed based on URL check after form submission.")
-            logger.info(f"Current page URL: {driver.current_url}")
-            logger.info("Current page title: " + driver.title)
+            # One script call fetches both diagnostics instead of two
+            # WebDriver property round-trips.
+            page_url, page_title = driver.execute_script("return [location.href, document.title];")
+            logger.info(f"Current page URL: {page_url}")
+            logger.info(f"Current page title: {page_title}")
 
         logger.info("Script has finished its tasks.")
 
@@ -280,6 +378,13 @@ def login_to_mca_and_verify(driver: webdriver.Firefox, config: dict):
             
     return driver, login_successful
 
+# Per-driver {(current_url, target_url) -> decision}. The URL checks are
+# cheap but the element-probe fallback is a live DOM query per call, and its
+# answer depends on the session's login state, not just the URL — so the map
+# is keyed by driver (dying with it, like selenium_utils' element cache) and
+# cleared when that driver's login succeeds.
+_login_required_cache = WeakKeyDictionary()
+
 def check_login_required(driver: webdriver.Firefox, target_url: str):
     """
     Check if login is required by comparing current URL with target URL
@@ -292,29 +397,47 @@ def check_login_required(driver: webdriver.Firefox, target_url: str):
         bool: True if login is required, False otherwise
     """
     current_url = driver.current_url
+    cache = _login_required_cache.setdefault(driver, {})
+    cache_key = (current_url, target_url)
+    if cache_key in cache:
+        logger.info(f"Using cached login-required decision for {current_url}")
+        return cache[cache_key]
     logger.info(f"Checking if login is required. Current URL: {current_url}, Target URL: {target_url}")
     
     # Check if we're already on the target page (SPICE form)
     if target_url in current_url:
         logger.info("Already on the target page, login not required.")
+        cache[cache_key] = False
+        return False
+
+    # An authenticated session is the only way to reach application history,
+    # so landing there means the stored session is alive.
+    if APPLICATION_HISTORY_URL in current_url:
+        logger.info("Already on application history (authenticated), login not required.")
+        cache[cache_key] = False
         return False
     
     # Check if we're on the login page
     if LOGIN_URL in current_url or "fologin.html" in current_url:
         logger.info("Login page detected, login required.")
+        cache[cache_key] = True
         return True
     
     # Neither on login page nor target page - check for other indicators
     try:
         # Look for login elements that would only be present if login is required
-        login_elements = driver.find_elements(By.XPATH, f"{ELEMENTS['LOGIN_PASSWORD_FIELD'][1]} | {ELEMENTS['LOGIN_BUTTON'][1]}")
+        # Both locators are CSS now, so one grouped selector checks them
+        # together (the old XPath union mixed a CSS string into an XPath).
+        login_elements = driver.find_elements(By.CSS_SELECTOR, f"{E.LOGIN_PASSWORD_FIELD[1]}, {E.LOGIN_BUTTON[1]}")
         if login_elements:
             logger.info("Login elements detected on page, login required.")
+            cache[cache_key] = True
             return True
     except Exception as e:
         logger.warning(f"Error checking for login elements: {e}")
     
     logger.info("Login not required (no clear indicators).")
+    cache[cache_key] = False
     return False
 
 # Main function for when this script is run directly (for testing login)
@@ -323,13 +446,10 @@ if __name__ == "__main__":
     log_file = setup_logging()
     logger.info("Running login_with_persistence.py directly.")
     
-    # Load config from config.json for direct execution
-    try:
-        with open("config.json", "r") as f:
-            app_config = json.load(f)
-    except FileNotFoundError:
-        logger.error("config.json not found. Cannot run login_with_persistence.py directly without it.")
-        exit(1)
+    # Load config via main's mtime-cached loader so the standalone run shares
+    # the same parsed (and cached) dict as every other entry point.
+    from main import load_config
+    app_config = load_config()
     
     # Initialize Firefox driver for this standalone test
     browser_options = FirefoxOptions()
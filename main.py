@@ -1,17 +1,20 @@
-import json
+import functools
+import re
+import orjson
+from pathlib import Path
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
 import os
 import time
 import logging
 from datetime import datetime
+from types import MappingProxyType
 import browser_setup  # Import the browser setup module
-from scrape_tabs import scrape_all_tabs  # Import scrape_all_tabs
-from config import ELEMENTS, DEFAULT_TIMEOUT, DEFAULT_RETRIES, SPICE_FORM_URL # Import locators and defaults
+from scrape_tabs import scrape_all_tabs, wait_for_results_tables  # wait is used by handle_name_check_and_submit
+from config import E, DEFAULT_TIMEOUT, DEFAULT_RETRIES, SPICE_FORM_URL, nic_checkbox_locator # Import locators and defaults
 from selenium_utils import ( # Import robust helper functions
     _click_element, _send_text, _wait_for_element_clickable,
-    _wait_for_element_presence, _save_screenshot_on_error,
+    _wait_for_element_presence, _wait_for_page_to_load, _save_screenshot_on_error,
     VerificationStepFailed, AutomationError
 )
 from selenium.webdriver.support import expected_conditions as EC # For EC conditions in success/failure
@@ -22,48 +25,72 @@ from selenium.webdriver.support.ui import WebDriverWait
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
 
-def load_config():
-    """Load configuration from config.json file"""
-    logger.info('Loading configuration from config.json')
+@functools.lru_cache(maxsize=2)
+def _load_config_cached(path: str, mtime: float):
+    """Parse the config file; mtime is part of the key so edits bust the cache."""
+    logger.info('Loading configuration from %s', path)
+    config = orjson.loads(Path(path).read_bytes())
+    logger.info('Configuration loaded successfully')
+    return config
+
+
+def load_config(path: str = 'config.json'):
+    """
+    Load configuration from config.json file.
+
+    Cached so the several modules that need the base config at import time
+    (api, api_v1, the CLI entry point) share one parse and one dict object
+    instead of re-reading the file per importer. The file's mtime is part of
+    the cache key, so edits to config.json are picked up on the next call.
+    """
     try:
-        with open('config.json', 'r') as f:
-            config = json.load(f)
-            logger.info('Configuration loaded successfully')
-            return config
+        return _load_config_cached(path, os.stat(path).st_mtime)
     except FileNotFoundError:
-        logger.error('config.json file not found!')
+        logger.error('%s file not found!', path)
         _save_screenshot_on_error(None, logger, "config_not_found") # No driver yet
         exit(1)
-    except json.JSONDecodeError as e:
-        logger.error(f'Invalid JSON format in config.json! {e}')
+    except orjson.JSONDecodeError as e:
+        logger.error('Invalid JSON format in %s! %s', path, e)
         _save_screenshot_on_error(None, logger, "config_json_error") # No driver yet
         exit(1)
     except Exception as e:
-        logger.error(f'Unexpected error loading config: {str(e)}')
+        logger.error('Unexpected error loading config: %s', e)
         _save_screenshot_on_error(None, logger, "config_load_error") # No driver yet
         exit(1)
 
+def freeze_config(config):
+    """
+    Return a read-only view of a loaded config (including the nested 'meta'
+    mapping). The API modules share one base config across all requests;
+    freezing it makes any accidental in-place mutation raise instead of
+    silently leaking one request's overrides into the next.
+    """
+    frozen = dict(config)
+    if isinstance(frozen.get("meta"), dict):
+        frozen["meta"] = MappingProxyType(frozen["meta"])
+    return MappingProxyType(frozen)
+
+
 def click_okay_button(driver):
     """Click the okay button after page load using robust utility."""
     logger.info('[FORM] Waiting for page to load and okay button to be clickable')
     start_time = time.time()
     try:
-        _click_element(driver, logger, ELEMENTS["OK_BUTTON_POPUP"])
-        logger.info(f'[FORM] Successfully clicked the okay button in {time.time() - start_time:.2f} seconds')
+        _click_element(driver, logger, E.OK_BUTTON_POPUP)
+        logger.info('[FORM] Successfully clicked the okay button in %.2f seconds', time.time() - start_time)
         # Wait for modal backdrop to disappear
         logger.info('[FORM] Waiting for modal backdrop to disappear')
-        WebDriverWait(driver, DEFAULT_TIMEOUT).until(EC.invisibility_of_element_located(ELEMENTS["MODAL_BACKDROP"]))
-        time.sleep(2)  # Additional wait to ensure modal is fully gone
+        WebDriverWait(driver, DEFAULT_TIMEOUT).until(EC.invisibility_of_element_located(E.MODAL_BACKDROP))
         logger.info('[FORM] Modal backdrop disappeared successfully')
     except Exception as e:
-        logger.error(f'[FORM] Error clicking okay button: {str(e)}')
+        logger.error('[FORM] Error clicking okay button: %s', e)
         _save_screenshot_on_error(driver, logger, "click_okay_button_failure")
         raise
 
 def _select_dropdown_option(driver, logger, dropdown_locator, option_value, option_text, step_name):
     """Helper to select option from a dropdown robustly."""
     try:
-        logger.info(f'Waiting for {step_name} dropdown to be present and clickable')
+        logger.info('Waiting for %s dropdown to be present and clickable', step_name)
         dropdown_element = _wait_for_element_clickable(driver, logger, dropdown_locator)
         
         # Try to remove any remaining modal backdrop using JavaScript
@@ -76,13 +103,12 @@ def _select_dropdown_option(driver, logger, dropdown_locator, option_value, opti
             """)
             logger.info('Removed any remaining modal backdrop')
         except Exception as e:
-            logger.debug(f'No modal backdrop to remove or error during removal: {e}')
+            logger.debug('No modal backdrop to remove or error during removal: %s', e)
         
         driver.execute_script("arguments[0].scrollIntoView(true);", dropdown_element)
-        time.sleep(1) # Wait for scroll to complete
         
         dropdown = Select(dropdown_element)
-        logger.info(f'Selecting "{option_text}" from {step_name} dropdown')
+        logger.info('Selecting "%s" from %s dropdown', option_text, step_name)
         
         try:
             dropdown.select_by_value(option_value)
@@ -101,56 +127,169 @@ def _select_dropdown_option(driver, logger, dropdown_locator, option_value, opti
                     dropdown_element
                 )
         
-        logger.info(f'Successfully selected {step_name}')
-        time.sleep(1) # Wait for selection to take effect
+        logger.info('Successfully selected %s', step_name)
+        try:
+            # Wait until the dropdown actually reflects the selection instead
+            # of sleeping a fixed second.
+            WebDriverWait(driver, 3).until(
+                lambda d: dropdown_element.get_attribute('value') == option_value
+            )
+        except TimeoutException:
+            logger.warning('%s dropdown did not reflect "%s" within 3s; continuing.', step_name, option_value)
         
     except Exception as e:
-        logger.error(f'Error selecting {step_name}: {str(e)}')
+        logger.error('Error selecting %s: %s', step_name, e)
         _save_screenshot_on_error(driver, logger, f"select_{step_name.replace(' ', '_')}_failure")
         raise
 
 def select_company_type(driver):
     """Select 'New Company (Others)' from the dropdown."""
-    _select_dropdown_option(driver, logger, ELEMENTS["COMPANY_TYPE_DROPDOWN"], "New Company (Others)", "New Company (Others)", "company type")
+    _select_dropdown_option(driver, logger, E.COMPANY_TYPE_DROPDOWN, "New Company (Others)", "New Company (Others)", "company type")
 
 def select_company_class(driver):
     """Select 'Private' from the company class dropdown."""
-    _select_dropdown_option(driver, logger, ELEMENTS["COMPANY_CLASS_DROPDOWN"], "Private", "Private", "company class")
+    _select_dropdown_option(driver, logger, E.COMPANY_CLASS_DROPDOWN, "Private", "Private", "company class")
 
 def select_company_category(driver):
     """Select 'Company limited by shares' from the company category dropdown."""
-    _select_dropdown_option(driver, logger, ELEMENTS["COMPANY_CATEGORY_DROPDOWN"], "Company limited by shares", "Company limited by shares", "company category")
+    _select_dropdown_option(driver, logger, E.COMPANY_CATEGORY_DROPDOWN, "Company limited by shares", "Company limited by shares", "company category")
 
 def select_company_subcategory(driver):
     """Select 'Non-government company' from the company sub-category dropdown."""
-    _select_dropdown_option(driver, logger, ELEMENTS["COMPANY_SUB_CATEGORY_DROPDOWN"], "Non-government company", "Non-government company", "company sub-category")
+    _select_dropdown_option(driver, logger, E.COMPANY_SUB_CATEGORY_DROPDOWN, "Non-government company", "Non-government company", "company sub-category")
+
+# The four company-profile dropdowns are independent in the DOM, so they can
+# be set together instead of one Select round-trip each.
+COMPANY_PROFILE_SELECTIONS = [
+    (E.COMPANY_TYPE_DROPDOWN[1], "New Company (Others)"),
+    (E.COMPANY_CLASS_DROPDOWN[1], "Private"),
+    (E.COMPANY_CATEGORY_DROPDOWN[1], "Company limited by shares"),
+    (E.COMPANY_SUB_CATEGORY_DROPDOWN[1], "Non-government company"),
+]
+
+_BULK_FILL_JS = """
+var pairs = arguments[0];
+var missing = [];
+pairs.forEach(function(pair) {
+    var el = document.getElementById(pair[0]);
+    if (!el) { missing.push(pair[0]); return; }
+    el.value = pair[1];
+    // Assigning a value that isn't among the select's options leaves
+    // el.value as '' (e.g. a dependent dropdown not yet populated);
+    // report it so the sequential fallback runs, as select_by_value
+    // would have raised.
+    if (el.value !== pair[1]) { missing.push(pair[0]); return; }
+    el.dispatchEvent(new Event('change', { 'bubbles': true }));
+});
+return missing;
+"""
+
+
+def select_company_profile(driver):
+    """
+    Fill the company type/class/category/sub-category dropdowns in a single
+    execute_script call instead of four separate Select round-trips. Falls
+    back to the per-dropdown flow if any dropdown is missing from the DOM.
+    """
+    logger.info('Filling company profile dropdowns in one bulk call')
+    try:
+        # Make sure the form is interactable before touching the DOM directly.
+        _wait_for_element_clickable(driver, logger, E.COMPANY_TYPE_DROPDOWN)
+        missing = driver.execute_script(_BULK_FILL_JS, COMPANY_PROFILE_SELECTIONS)
+        if missing:
+            raise AutomationError(f"Dropdowns not found for bulk fill: {missing}")
+        logger.info('Company profile dropdowns filled in one call')
+    except Exception as e:
+        logger.warning('Bulk dropdown fill failed (%s); falling back to sequential selection.', e)
+        select_company_type(driver)
+        select_company_class(driver)
+        select_company_category(driver)
+        select_company_subcategory(driver)
+
 
 def open_nic_code_dialog(driver):
     """Click the NIC button to open the NIC code selection dialog using robust utility."""
     logger.info('Opening NIC code selection dialog.')
     try:
-        _click_element(driver, logger, ELEMENTS["NIC_BUTTON"])
-        time.sleep(1)
+        _click_element(driver, logger, E.NIC_BUTTON)
+        # Dialog is open once its search bar is present.
+        _wait_for_element_presence(driver, logger, E.NIC_SEARCH_BAR)
     except Exception as e:
-        logger.error(f'Error opening NIC code dialog: {str(e)}')
+        logger.error('Error opening NIC code dialog: %s', e)
         _save_screenshot_on_error(driver, logger, "open_nic_dialog_failure")
         raise
 
+# Clicks every requested NIC checkbox inside the browser and reports the
+# codes whose checkbox was not present, so Python can fall back to the
+# search-driven flow for just those.
+_BULK_NIC_JS = """
+var codes = arguments[0];
+var missing = [];
+codes.forEach(function (code) {
+    var cb = document.querySelector('input[type="checkbox"][value="' + code + '"]');
+    if (!cb) { missing.push(code); return; }
+    if (!cb.checked) { cb.click(); }
+});
+return missing;
+"""
+
 def select_nic_codes_dynamic(driver, nic_codes_str):
     """
-    Select multiple NIC codes by searching and checking each one, then click Add once at the end.
-    Uses robust utilities.
+    Select multiple NIC codes, preferring a single in-browser pass over the
+    fully-loaded table, then click Add once at the end. Codes whose checkbox
+    is not in the DOM (not on the current page) fall back to the original
+    search-and-click flow. Uses robust utilities.
     """
     nic_codes = [code.strip() for code in nic_codes_str.split(',') if code.strip()]
-    
+    if not nic_codes:
+        logger.warning('No NIC codes to select.')
+        return
+
+    try:
+        # Show the largest page once so as many checkboxes as possible are in
+        # the DOM, then toggle them all in one execute_script round-trip.
+        dropdown_element = _wait_for_element_clickable(driver, logger, E.NIC_PAGE_SIZE_DROPDOWN)
+        Select(dropdown_element).select_by_value('100')
+        missing = driver.execute_script(_BULK_NIC_JS, nic_codes)
+        selected = [code for code in nic_codes if code not in missing]
+        if selected:
+            logger.info('Selected NIC codes in one browser pass: %s', ", ".join(selected))
+    except Exception as e:
+        logger.warning('Bulk NIC selection failed (%s); falling back to per-code flow for all codes.', e)
+        missing = nic_codes
+
+    if missing:
+        logger.info('Falling back to search-driven selection for NIC codes: %s', ", ".join(missing))
+        _select_nic_codes_sequential(driver, missing)
+
+    # After all codes are checked, click the Add button
+    logger.info('Clicking Add button after selecting all NIC codes')
+    try:
+        _click_element(driver, logger, E.NIC_ADD_BUTTON)
+        try:
+            # The dialog closing (search bar gone) confirms the codes were added.
+            WebDriverWait(driver, DEFAULT_TIMEOUT).until(
+                EC.invisibility_of_element_located(E.NIC_SEARCH_BAR)
+            )
+        except TimeoutException:
+            logger.warning('NIC dialog still visible after Add; continuing.')
+    except Exception as e:
+        logger.error('Error clicking Add button for NIC codes: %s', e)
+        _save_screenshot_on_error(driver, logger, "nic_add_button_failure")
+        raise
+
+def _select_nic_codes_sequential(driver, nic_codes):
+    """
+    Original search-driven selection: filter the table per code and click its
+    checkbox. Kept as the fallback when a checkbox isn't in the loaded page.
+    """
     for idx, code in enumerate(nic_codes):
-        logger.info(f'Starting NIC code selection for: {code}')
+        logger.info('Starting NIC code selection for: %s', code)
         try:
-            _send_text(driver, logger, ELEMENTS["NIC_SEARCH_BAR"], code, clear_first=True)
-            time.sleep(1.5) # Wait for table to update
+            _send_text(driver, logger, E.NIC_SEARCH_BAR, code, clear_first=True)
 
             # Select dropdown value based on code index
-            dropdown_element = _wait_for_element_clickable(driver, logger, ELEMENTS["NIC_PAGE_SIZE_DROPDOWN"])
+            dropdown_element = _wait_for_element_clickable(driver, logger, E.NIC_PAGE_SIZE_DROPDOWN)
             select = Select(dropdown_element)
             
             page_size_value = '100' # Default
@@ -161,73 +300,65 @@ def select_nic_codes_dynamic(driver, nic_codes_str):
             elif idx == 2:
                 page_size_value = '100'
             
-            logger.info(f'Selecting "{page_size_value}" in page size dropdown for NIC code {code}')
+            logger.info('Selecting "%s" in page size dropdown for NIC code %s', page_size_value, code)
             select.select_by_value(page_size_value)
-            time.sleep(0.5)
 
-            checkbox_locator = (By.XPATH, ELEMENTS["NIC_CHECKBOX_XPATH"].format(code))
+            # Waiting for the checkbox doubles as waiting for the filtered
+            # table to finish re-rendering.
+            checkbox_locator = nic_checkbox_locator(code)
             checkbox = _wait_for_element_clickable(driver, logger, checkbox_locator)
             
             if not checkbox.is_selected():
-                logger.info(f'Clicking checkbox for NIC code {code}')
+                logger.info('Clicking checkbox for NIC code %s', code)
                 _click_element(driver, logger, checkbox_locator)
             else:
-                logger.info(f'Checkbox for NIC code {code} already selected')
-            time.sleep(0.5)
+                logger.info('Checkbox for NIC code %s already selected', code)
         except Exception as e:
-            logger.error(f'Error selecting NIC code {code}: {str(e)}')
+            logger.error('Error selecting NIC code %s: %s', code, e)
             _save_screenshot_on_error(driver, logger, f"nic_code_selection_failure_{code}")
             raise # Re-raise to stop if a NIC code fails
-    
-    # After all codes are checked, click the Add button
-    logger.info('Clicking Add button after selecting all NIC codes')
-    try:
-        _click_element(driver, logger, ELEMENTS["NIC_ADD_BUTTON"])
-        time.sleep(1)
-    except Exception as e:
-        logger.error(f'Error clicking Add button for NIC codes: {str(e)}')
-        _save_screenshot_on_error(driver, logger, "nic_add_button_failure")
-        raise
+
+# Matches an existing PRIVATE LIMITED suffix/phrase on the uppercased name.
+_PL_RE = re.compile(r'\bPRIVATE LIMITED\b')
 
 def format_company_name(name):
     """Format company name according to requirements"""
-    logger.debug(f'[FORM] Formatting company name: {name}')
-    name = name.upper()
-    logger.debug(f'[FORM] Name converted to uppercase: {name}')
-    
-    if "PRIVATE LIMITED" not in name.upper():
-        name = f"{name} PRIVATE LIMITED"
-        logger.debug(f'[FORM] Added "PRIVATE LIMITED" suffix: {name}')
-    else:
-        logger.debug(f'[FORM] "PRIVATE LIMITED" already exists in name, no change needed')
-    return name
+    upper = name.upper()
+    return upper if _PL_RE.search(upper) else f"{upper} PRIVATE LIMITED"
+
+# Sets the value, fires the framework events, and echoes the value back,
+# all in one WebDriver round-trip. Looking the element up by id inside
+# the script also removes the stale-element window between a Python-side
+# find_element and the subsequent interaction.
+_SET_NAME_JS = """
+var e = document.getElementById(arguments[0]);
+if (!e) { return null; }
+e.value = arguments[1];
+e.dispatchEvent(new Event('input', { bubbles: true }));
+e.dispatchEvent(new Event('change', { bubbles: true }));
+return e.value;
+"""
 
 def enter_company_name(driver, company_name):
     """Enter the formatted company name in the input field using robust utility."""
     logger.info('Waiting for company name input field to be present')
     formatted_name = format_company_name(company_name)
-    logger.info(f'Formatted company name: {formatted_name}')
+    logger.info('Formatted company name: %s', formatted_name)
     
     try:
-        _send_text(driver, logger, ELEMENTS["COMPANY_NAME_INPUT"], formatted_name)
-        
-        # Optional: Verify the entered text (this is a good practice)
-        entered_value = driver.find_element(*ELEMENTS["COMPANY_NAME_INPUT"]).get_attribute('value')
+        # Ensure the field exists before touching it, then set + verify the
+        # value in a single script call instead of send_keys plus repeated
+        # find_element/get_attribute round-trips.
+        _wait_for_element_presence(driver, logger, E.COMPANY_NAME_INPUT)
+        entered_value = driver.execute_script(
+            _SET_NAME_JS, E.COMPANY_NAME_INPUT[1], formatted_name
+        )
         if entered_value != formatted_name:
-            logger.warning(f'Text verification failed for company name. Expected: {formatted_name}, Got: {entered_value}. Attempting JS input.')
-            driver.execute_script(
-                "arguments[0].value = arguments[1];",
-                driver.find_element(*ELEMENTS["COMPANY_NAME_INPUT"]),
-                formatted_name
-            )
-            driver.execute_script(
-                "arguments[0].dispatchEvent(new Event('change', { 'bubbles': true }));",
-                driver.find_element(*ELEMENTS["COMPANY_NAME_INPUT"])
-            )
+            logger.warning('JS input verification failed for company name. Expected: %s, Got: %s. Falling back to send_keys.', formatted_name, entered_value)
+            _send_text(driver, logger, E.COMPANY_NAME_INPUT, formatted_name)
         logger.info('Successfully entered company name')
-        time.sleep(1)
     except Exception as e:
-        logger.error(f'Error entering company name: {str(e)}')
+        logger.error('Error entering company name: %s', e)
         _save_screenshot_on_error(driver, logger, "enter_company_name_failure")
         raise
 
@@ -235,11 +366,11 @@ def handle_name_check_and_submit(driver):
     """Handle the auto-check process only (do not click submit) using robust utility."""
     logger.info('Starting name auto-check process')
     try:
-        _click_element(driver, logger, ELEMENTS["AUTO_CHECK_BUTTON"])
-        time.sleep(3) # Wait for auto-check to complete
+        _click_element(driver, logger, E.AUTO_CHECK_BUTTON)
+        wait_for_results_tables(driver)  # Auto-check is done once the tables render
         logger.info('Auto-check completed (submit not clicked, as requested)')
     except Exception as e:
-        logger.error(f'Error in name check process: {str(e)}')
+        logger.error('Error in name check process: %s', e)
         _save_screenshot_on_error(driver, logger, "name_auto_check_failure")
         raise
 
@@ -247,15 +378,14 @@ def click_proceed_incorporation(driver):
     """Click the 'Proceed for Incorporation' radio button using robust utility."""
     logger.info('Clicking Proceed for Incorporation radio button')
     try:
-        _click_element(driver, logger, ELEMENTS["PROCEED_INCORPORATION_RADIO"])
+        _click_element(driver, logger, E.PROCEED_INCORPORATION_RADIO)
         # Verify the radio button is selected
-        is_selected = driver.find_element(*ELEMENTS["PROCEED_INCORPORATION_RADIO"]).is_selected()
+        is_selected = driver.find_element(*E.PROCEED_INCORPORATION_RADIO).is_selected()
         if not is_selected:
             raise AutomationError("Failed to select the radio button")
         logger.info('Successfully selected Proceed for Incorporation option')
-        time.sleep(1)
     except Exception as e:
-        logger.error(f'Error selecting Proceed for Incorporation option: {str(e)}')
+        logger.error('Error selecting Proceed for Incorporation option: %s', e)
         _save_screenshot_on_error(driver, logger, "proceed_incorporation_failure")
         raise
 
@@ -263,12 +393,12 @@ def click_continue_button(driver):
     """Click the Continue button to complete the first path using robust utility."""
     logger.info('Clicking Continue button')
     try:
-        _click_element(driver, logger, ELEMENTS["CONTINUE_BUTTON"])
+        _click_element(driver, logger, E.CONTINUE_BUTTON)
         logger.info('Successfully clicked Continue button')
+        _wait_for_page_to_load(driver, logger)
         logger.info('First path completed successfully')
-        time.sleep(2)
     except Exception as e:
-        logger.error(f'Error clicking Continue button: {str(e)}')
+        logger.error('Error clicking Continue button: %s', e)
         _save_screenshot_on_error(driver, logger, "continue_button_failure")
         raise
 
@@ -294,19 +424,14 @@ def main():
         
         # Part A of the form - Calling high-level functions
         click_okay_button(driver)
-        select_company_type(driver)
-        select_company_class(driver)
-        select_company_category(driver)
-        select_company_subcategory(driver)
+        select_company_profile(driver)
         open_nic_code_dialog(driver)
         select_nic_codes_dynamic(driver, config['meta']['nic_code'])
         enter_company_name(driver, config['meta']['company_name'])
         handle_name_check_and_submit(driver)
         
-        # Wait for tables to load after auto-check
-        time.sleep(3)
-        
-        # Scrape all tabs after auto-check
+        # Scrape all tabs after auto-check (handle_name_check_and_submit
+        # already waited for the result tables)
         scrape_all_tabs(driver)
         
         print("\nAutomation stopped after auto-check as requested.")
@@ -314,7 +439,7 @@ def main():
         input()
         
     except (AutomationError, VerificationStepFailed, Exception) as e:
-        logger.error(f'Error during automation: {str(e)}')
+        logger.error('Error during automation: %s', e)
         # Take screenshot on error if driver is available and error was not from _save_screenshot_on_error itself
         if driver:
             _save_screenshot_on_error(driver, logger, "automation_script_failure")
@@ -0,0 +1,104 @@
+import logging
+import sys
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+# Two trademark words whose fuzz.ratio exceeds this are treated as duplicates.
+DEDUP_THRESHOLD = 90
+
+# rapidfuzz + numpy give a single vectorized C call for the whole pairwise
+# comparison matrix; without them we fall back to a per-pair Python loop.
+try:
+    import numpy as np
+    from rapidfuzz import fuzz, process
+    _HAVE_CDIST = True
+except ImportError:
+    np = None
+    _HAVE_CDIST = False
+    try:
+        from rapidfuzz import fuzz
+        _HAVE_RAPIDFUZZ = True
+    except ImportError:
+        _HAVE_RAPIDFUZZ = False
+        from difflib import SequenceMatcher
+
+
+def _pair_ratio(a: str, b: str, score_cutoff: float = None) -> float:
+    """
+    Similarity of two lowercased words on a 0-100 scale.
+
+    With rapidfuzz, score_cutoff lets the C core fast-fail: when the length
+    difference alone already caps the score below the cutoff it returns 0
+    after an O(|len(a)-len(b)|) check instead of running the full alignment.
+    """
+    if _HAVE_CDIST or _HAVE_RAPIDFUZZ:
+        return fuzz.ratio(a, b, score_cutoff=score_cutoff)
+    return SequenceMatcher(None, a, b).ratio() * 100
+
+
+def simplify_trademarks(words: list, threshold: int = DEDUP_THRESHOLD) -> list:
+    """
+    Collapse near-duplicate trademark words, keeping the first occurrence
+    (original casing) of each group in first-seen order.
+
+    The scraped trademark tab routinely repeats the same word across
+    registrations ('DIGITAL', 'Digital', 'DIGITAL INDIA'); comparing every
+    pair through fuzz.ratio in Python is O(n^2) calls, so when rapidfuzz and
+    numpy are available the whole comparison matrix is computed in one
+    vectorized process.cdist call instead.
+    """
+    keys = [w.lower() for w in words]
+    if not keys:
+        return []
+
+    # For a handful of words the fuzzy machinery costs more than it saves:
+    # exact case-insensitive dedup in one dict pass is enough.
+    if len(keys) <= 4:
+        seen = {}
+        for original, key in zip(words, keys):
+            seen.setdefault(key, original)
+        return list(seen.values())
+
+    if _HAVE_CDIST:
+        matrix = np.asarray(
+            process.cdist(keys, keys, scorer=fuzz.ratio, score_cutoff=threshold, workers=-1)
+        )
+        kept = []
+        duplicate = np.zeros(len(keys), dtype=bool)
+        for i in range(len(keys)):
+            if i and matrix[:i, i][~duplicate[:i]].max(initial=0) > threshold:
+                duplicate[i] = True
+            else:
+                kept.append(words[i])
+        return kept
+
+    # Length pre-filter for the per-pair path: fuzz.ratio can never exceed
+    # 200*min(la,lb)/(la+lb), so pairs whose lengths differ too much are
+    # skipped on an integer compare before any string alignment runs. The
+    # cdist path above already gets the same short-circuit from score_cutoff
+    # inside the C core.
+    # kept_keys (list) drives the fuzzy comparisons in order; kept_set gives
+    # O(1) membership for exact repeats, which dominate the scraped tab.
+    # Interned keys make that set lookup a pointer compare instead of a
+    # character-by-character hash/equality pass.
+    kept = []
+    kept_keys = []
+    kept_lens = []
+    kept_set = set()
+    for original, key in zip(words, keys):
+        key = sys.intern(key)
+        if key in kept_set:
+            continue
+        n = len(key)
+        duplicate = any(
+            200 * min(n, m) > threshold * (n + m)
+            and _pair_ratio(key, k, score_cutoff=threshold) > threshold
+            for k, m in zip(kept_keys, kept_lens)
+        )
+        if not duplicate:
+            kept.append(original)
+            kept_keys.append(key)
+            kept_lens.append(n)
+            kept_set.add(key)
+    return kept
@@ -1,16 +1,35 @@
-import json
 import logging
+
+import orjson
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import ElementClickInterceptedException, TimeoutException, NoSuchElementException
 
-from config import ELEMENTS, DEFAULT_TIMEOUT
+from config import E, DEFAULT_TIMEOUT
 from selenium_utils import _click_element, _wait_for_element_presence, _save_screenshot_on_error
 
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
 
+def wait_for_results_tables(driver, timeout=10):
+    """
+    Wait for the auto-check result tables to appear instead of sleeping a
+    fixed amount. Returns as soon as either the errors or the name-similarity
+    table is present in the DOM.
+    """
+    logger.info("[SCRAPE] Waiting for result tables to load after auto-check")
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.2).until(
+            EC.presence_of_element_located(
+                (By.CSS_SELECTOR, f"#{E.ERROR_TABLE[1]}, #{E.NAME_SIMILARITY_TABLE[1]}")
+            )
+        )
+        logger.info("[SCRAPE] Result tables detected")
+    except TimeoutException:
+        logger.warning(f"[SCRAPE] No result table appeared within {timeout}s; proceeding to scrape anyway.")
+
+
 def click_tab(driver, tab_locator, tab_name):
     """Clicks a tab using robust utility function."""
     try:
@@ -22,17 +41,40 @@ def click_tab(driver, tab_locator, tab_name):
         _save_screenshot_on_error(driver, logger, f"tab_click_failed_{tab_name}")
         raise # Re-raise to be caught by scrape_all_tabs for proper skipping
 
+# Collects every row's td texts in one call, so scraping costs a single
+# WebDriver round-trip instead of one per row and cell. Rows without td
+# cells (headers) come back as empty lists, matching the Python loop.
+# The matrix is JSON.stringify'd in the browser: one string crosses the
+# WebDriver bridge and orjson decodes it in a single pass, instead of
+# the bridge marshalling every cell as its own JSON fragment.
+_TABLE_ROWS_JS = """
+var t = arguments[1] === 'id'
+    ? document.getElementById(arguments[0])
+    : document.querySelector(arguments[0]);
+if (!t) { return null; }
+return JSON.stringify(Array.from(t.rows).map(function (r) {
+    return Array.from(r.querySelectorAll('td')).map(function (c) {
+        return c.innerText;
+    });
+}));
+"""
+
 def scrape_table(driver, table_locator, tab_name):
     """Scrapes data from a table using robust utility function."""
     logger.info(f"[SCRAPE] Waiting for table '{table_locator[1]}' in tab: {tab_name}")
     try:
         _wait_for_element_presence(driver, logger, table_locator)
-        table = driver.find_element(*table_locator)
-        rows = table.find_elements(By.TAG_NAME, "tr")
-        data = []
-        for row in rows:
-            cells = row.find_elements(By.TAG_NAME, "td")
-            data.append([cell.text for cell in cells])
+        payload = driver.execute_script(_TABLE_ROWS_JS, table_locator[1], table_locator[0])
+        data = orjson.loads(payload) if payload is not None else None
+        if data is None:
+            # Table vanished between the wait and the script; use the
+            # element-by-element path, which also reports the failure.
+            table = driver.find_element(*table_locator)
+            rows = table.find_elements(By.TAG_NAME, "tr")
+            data = []
+            for row in rows:
+                cells = row.find_elements(By.TAG_NAME, "td")
+                data.append([cell.text for cell in cells])
         logger.info(f"[SCRAPE] Scraped {len(data)} rows from table '{table_locator[1]}' in tab: {tab_name}")
         return data
     except (TimeoutException, NoSuchElementException) as e:
@@ -40,14 +82,67 @@ def scrape_table(driver, table_locator, tab_name):
         _save_screenshot_on_error(driver, logger, f"table_scrape_failed_{tab_name}")
         raise # Re-raise to be caught by scrape_all_tabs for proper skipping
 
-def scrape_all_tabs(driver, output_json_path="scraped_results.json"):
+# Clicks each tab and reads its table in one pass inside the browser,
+# returning null for any table that isn't in the DOM so Python can fall
+# back to the per-tab flow for just those entries. Returned as one JSON
+# string for the same single-decode reason as _TABLE_ROWS_JS.
+_ALL_TABS_JS = """
+var specs = arguments[0];
+return JSON.stringify(specs.map(function (spec) {
+    var tab;
+    if (spec.tabBy === 'xpath') {
+        tab = document.evaluate(spec.tabValue, document, null,
+                                XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    } else {
+        tab = document.getElementById(spec.tabValue);
+    }
+    if (tab) { tab.click(); }
+    var t = document.getElementById(spec.tableValue);
+    if (!t) { return null; }
+    return Array.from(t.rows).map(function (r) {
+        return Array.from(r.querySelectorAll('td')).map(function (c) {
+            return c.innerText;
+        });
+    });
+}));
+"""
+
+def scrape_all_tabs(driver, output_json_path="scraped_results.json", on_tab_scraped=None):
+    """
+    Scrape the result tabs in priority order (errors first, since they alone
+    decide whether a name is blocked).
+
+    When no early-exit callback is involved, all three tabs are clicked and
+    read in a single execute_script round-trip; tabs the script could not
+    resolve fall back to the per-tab Selenium flow below.
+
+    If on_tab_scraped is given it is called as on_tab_scraped(key, data)
+    after each tab; returning True stops the scrape early and the remaining
+    tabs are reported as None, letting callers skip tabs they no longer need.
+    """
     tab_mapping = {
-        "error": (ELEMENTS["ERROR_TAB"], ELEMENTS["ERROR_TABLE"]),
-        "name_similarity": (ELEMENTS["NAME_SIMILARITY_TAB"], ELEMENTS["NAME_SIMILARITY_TABLE"]),
-        "trademark": (ELEMENTS["TRADEMARK_TAB"], ELEMENTS["TRADEMARK_TABLE"])
+        "error": (E.ERROR_TAB, E.ERROR_TABLE),
+        "name_similarity": (E.NAME_SIMILARITY_TAB, E.NAME_SIMILARITY_TABLE),
+        "trademark": (E.TRADEMARK_TAB, E.TRADEMARK_TABLE)
     }
-    result = {}
-    for key, (tab_locator, table_locator) in tab_mapping.items():
+    result = {key: None for key in tab_mapping}
+    remaining = tab_mapping
+    if on_tab_scraped is None:
+        try:
+            specs = [
+                {"tabBy": tab[0], "tabValue": tab[1], "tableValue": table[1]}
+                for tab, table in tab_mapping.values()
+            ]
+            batch = orjson.loads(driver.execute_script(_ALL_TABS_JS, specs))
+            for key, data in zip(tab_mapping, batch):
+                result[key] = data
+            remaining = {k: v for k, v in tab_mapping.items() if result[k] is None}
+            if remaining:
+                logger.info(f"[SCRAPE] Batch scrape missed tabs {list(remaining)}; retrying them individually.")
+        except Exception as e:
+            logger.warning(f"[SCRAPE] Batch tab scrape failed ({e}); falling back to per-tab scraping.")
+            remaining = tab_mapping
+    for key, (tab_locator, table_locator) in remaining.items():
         tab_name = key.replace('_', ' ').title()
         try:
             click_tab(driver, tab_locator, tab_name)
@@ -57,11 +152,17 @@ def scrape_all_tabs(driver, output_json_path="scraped_results.json"):
             logger.warning(f"[SCRAPE] Skipping {tab_name} tab due to previous error.")
             result[key] = None
             continue # Continue to next tab even if one fails
+        if on_tab_scraped is not None and on_tab_scraped(key, data):
+            logger.info(f"[SCRAPE] Early exit requested after {tab_name} tab; skipping remaining tabs.")
+            break
     
     if output_json_path is not None:
         try:
-            with open(output_json_path, "w", encoding="utf-8") as f:
-                json.dump(result, f, ensure_ascii=False, indent=2)
+            # orjson serializes the nested lists in C and the bytes land in
+            # one buffered write instead of json.dump's many small ones.
+            payload = orjson.dumps(result, option=orjson.OPT_INDENT_2)
+            with open(output_json_path, "wb", buffering=1 << 20) as f:
+                f.write(payload)
             logger.info(f"[SCRAPE] All tab data saved to {output_json_path}")
         except Exception as e:
             logger.error(f"[SCRAPE] Error saving scraped data to JSON file: {e}")
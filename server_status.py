@@ -1,36 +1,62 @@
 # server_status.py
 
+import functools
+import importlib.util
+import re
 import requests
 import logging
-from typing import Tuple
+from typing import Tuple, Union
 
 # Initialize logger for this module
 logger = logging.getLogger(__name__)
 
-def check_server_status_robust(url: str, content_check_id: str, timeout: int = 10) -> Tuple[bool, str]:
+
+@functools.lru_cache(maxsize=16)
+def _compile_markers(markers: tuple) -> re.Pattern:
+    """One bytes-regex alternation over all markers.
+
+    A single linear pass over each chunk finds whichever marker hits first,
+    instead of one str.__contains__ scan per marker, and working on bytes
+    skips decoding the response to text altogether (the IDs are ASCII).
     """
-    Performs a robust server status check using a session and mimicking browser headers
-    to avoid being blocked by security measures like a WAF.
+    return re.compile(b"|".join(re.escape(m.encode("ascii")) for m in markers))
 
-    Args:
-        url: The URL to check.
-        content_check_id: The string (element ID) to search for in the page content.
-        timeout: Timeout in seconds for the GET request.
 
-    Returns:
-        A tuple containing:
-        - bool: True if the site is up and content is verified, False otherwise.
-        - str: A message describing the status.
+def _accept_encoding() -> str:
+    """Advertise only the encodings urllib3 can actually decode here.
+
+    Offering 'br, zstd' without the brotli/zstandard packages makes the
+    server send bodies requests hands back undecoded, which breaks the
+    content scan and forces a retry. When the decoders are installed the
+    smaller encodings are advertised and decoded transparently.
     """
-    # Create a session object to persist headers and cookies
-    session = requests.Session()
+    encodings = ["gzip", "deflate"]
+    if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi"):
+        encodings.append("br")
+    if importlib.util.find_spec("zstandard"):
+        encodings.append("zstd")
+    return ", ".join(encodings)
+
 
-    # Set the headers to mimic a real browser, based on the provided HAR file
+def _build_status_session() -> requests.Session:
+    """Module-level session for status checks.
+
+    A fresh Session per invocation threw away the connection pool, the TLS
+    session ticket, and the resolved DNS — every check paid a full
+    DNS+TCP+TLS handshake. Reusing one session lets keep-alive and TLS
+    resumption kick in from the second check onward.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    # Mimic a real browser, based on the provided HAR file, to avoid being
+    # blocked by security measures like a WAF.
     session.headers.update({
         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:139.0) Gecko/20100101 Firefox/139.0",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
         "Accept-Language": "en-US,en;q=0.5",
-        "Accept-Encoding": "gzip, deflate, br, zstd",
+        "Accept-Encoding": _accept_encoding(),
         "Referer": "https://www.mca.gov.in/content/mca/global/en/mca/e-filing/incorporation-change-services/spice.html",
         "Connection": "keep-alive",
         "Upgrade-Insecure-Requests": "1",
@@ -39,30 +65,73 @@ def check_server_status_robust(url: str, content_check_id: str, timeout: int = 1
         "Sec-Fetch-Site": "same-origin",
         "Sec-Fetch-User": "?1"
     })
+    return session
+
+
+_STATUS_SESSION = _build_status_session()
+
+
+def check_server_status_robust(url: str, content_check_id: Union[str, tuple], timeout: int = 10) -> Tuple[bool, str]:
+    """
+    Performs a robust server status check using a session and mimicking browser headers
+    to avoid being blocked by security measures like a WAF.
+
+    Args:
+        url: The URL to check.
+        content_check_id: The string (element ID) to search for in the page
+            content, or a tuple of such strings of which any one suffices.
+        timeout: Timeout in seconds for the GET request.
+
+    Returns:
+        A tuple containing:
+        - bool: True if the site is up and content is verified, False otherwise.
+        - str: A message describing the status.
+    """
+    # The shared session persists headers, cookies and live connections
+    # across checks.
+    session = _STATUS_SESSION
 
     try:
-        logger.info(f"[Status Check] Performing robust GET request to {url}")
-        
-        # The session will automatically handle any cookies set by the server
-        response = session.get(url, timeout=timeout)
-
-        # Check the final status code
-        if response.status_code == 200:
-            # If successful, verify the page content
-            if content_check_id in response.text:
-                logger.info("[Status Check] Request successful and page content verified.")
-                return True, "Website is online and operational."
-            else:
-                logger.warning(f"[Status Check] Website is online, but the expected content ('{content_check_id}') was not found. It may be a maintenance or error page.")
-                return False, "The website is online but not fully functional."
-        
-        elif response.status_code == 403:
+        # A HEAD request settles the status-code questions (403, 5xx,
+        # maintenance redirects) for the cost of headers only, so the
+        # multi-hundred-KB body is never transferred when the page is down.
+        # Servers that reject HEAD outright are treated as inconclusive.
+        logger.info(f"[Status Check] Performing HEAD request to {url}")
+        head = session.head(url, timeout=timeout, allow_redirects=True)
+        if head.status_code == 403:
             logger.error("[Status Check] Request failed with status code 403 (Forbidden). The server is actively blocking this script.")
             return False, "The server is blocking automated access."
-            
-        else:
-            logger.warning(f"[Status Check] Request failed with status code {response.status_code}.")
-            return False, f"The website returned an error (Status: {response.status_code})."
+        if head.status_code != 200 and head.status_code not in (405, 501):
+            logger.warning(f"[Status Check] Request failed with status code {head.status_code}.")
+            return False, f"The website returned an error (Status: {head.status_code})."
+
+        logger.info(f"[Status Check] Performing streaming GET request to {url}")
+
+        # Stream the body and stop reading the moment the marker appears;
+        # the marker sits near the top of the page, so this usually reads a
+        # chunk or two instead of the whole document. The rolling tail keeps
+        # matches that straddle a chunk boundary from being missed.
+        with session.get(url, timeout=timeout, stream=True) as response:
+            if response.status_code == 200:
+                markers = (content_check_id,) if isinstance(content_check_id, str) else tuple(content_check_id)
+                pattern = _compile_markers(markers)
+                tail_len = max(len(m) for m in markers) - 1
+                tail = b""
+                for chunk in response.iter_content(chunk_size=16384):
+                    if pattern.search(tail + chunk):
+                        logger.info("[Status Check] Request successful and page content verified.")
+                        return True, "Website is online and operational."
+                    tail = chunk[-tail_len:] if tail_len else b""
+                logger.warning(f"[Status Check] Website is online, but the expected content ('{content_check_id}') was not found. It may be a maintenance or error page.")
+                return False, "The website is online but not fully functional."
+
+            elif response.status_code == 403:
+                logger.error("[Status Check] Request failed with status code 403 (Forbidden). The server is actively blocking this script.")
+                return False, "The server is blocking automated access."
+
+            else:
+                logger.warning(f"[Status Check] Request failed with status code {response.status_code}.")
+                return False, f"The website returned an error (Status: {response.status_code})."
 
     except requests.exceptions.Timeout:
         logger.error(f"[Status Check] Request to {url} timed out after {timeout} seconds.")
@@ -0,0 +1,63 @@
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+# Initialize logger for this module
+logger = logging.getLogger(__name__)
+
+# Worker count should match the browser pool size so jobs never queue on a
+# worker thread while a driver sits idle (or vice versa).
+WORKER_COUNT = int(os.getenv("NAME_CHECK_WORKERS", os.getenv("BROWSER_POOL_SIZE", "4")))
+
+# How long finished job results are kept before being evicted.
+RESULT_TTL_SECONDS = int(os.getenv("NAME_CHECK_RESULT_TTL", "3600"))
+
+_executor = ThreadPoolExecutor(max_workers=WORKER_COUNT, thread_name_prefix="name-check")
+_results = {}  # job_id -> {"status": ..., "result": ..., "expires_at": ...}
+_results_lock = threading.Lock()
+
+
+def _evict_expired():
+    """Drop finished results older than RESULT_TTL_SECONDS. Caller holds the lock."""
+    now = time.time()
+    for job_id in [j for j, entry in _results.items() if entry.get("expires_at", now + 1) <= now]:
+        del _results[job_id]
+
+
+def submit_job(fn, *args, **kwargs) -> str:
+    """
+    Run fn(*args, **kwargs) on a worker thread and return a job id immediately.
+
+    The HTTP handler stays responsive while the multi-minute Selenium flow
+    runs in the background; clients poll get_job(job_id) for the outcome.
+    """
+    job_id = uuid.uuid4().hex
+    with _results_lock:
+        _evict_expired()
+        _results[job_id] = {"status": "pending"}
+
+    def _run():
+        try:
+            result = fn(*args, **kwargs)
+            entry = {"status": "done", "result": result}
+        except Exception as e:
+            logger.exception(f"[TASKS] Job {job_id} failed: {e}")
+            entry = {"status": "error", "error": str(e)}
+        entry["expires_at"] = time.time() + RESULT_TTL_SECONDS
+        with _results_lock:
+            _results[job_id] = entry
+
+    _executor.submit(_run)
+    logger.info(f"[TASKS] Submitted job {job_id}")
+    return job_id
+
+
+def get_job(job_id: str):
+    """Return the stored state for a job id, or None if unknown/expired."""
+    with _results_lock:
+        _evict_expired()
+        entry = _results.get(job_id)
+        return dict(entry) if entry is not None else None